@@ -90,7 +90,7 @@ class SecurityConfig:
     # Yasakli path pattern'leri
     FORBIDDEN_PATH_PATTERNS: List[str] = field(default_factory=lambda: [
         '..', '/etc/', '/var/', '/usr/', '/root/', '/home/',
-        'passwd', 'shadow', '.ssh', '.env', 'credentials'
+        'passwd', 'shadow', '.ssh', '.env', 'credentials', '\x00'
     ])
 
     # Prompt injection pattern'leri
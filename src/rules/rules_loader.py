@@ -14,6 +14,31 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 
 
+# LoadedRules üzerindeki kural dosyası alanları (sıralı)
+_RULE_ATTRS = (
+    'general_rules',
+    'research_rules',
+    'content_rules',
+    'source_rules',
+    'validation_rules',
+    'quality_standards',
+)
+
+# İçerik kurallarındaki minimum değerler tek geçişte okunur
+_RE_CONTENT_VALUES = re.compile(
+    r'''
+    (?P<kind>word_count|paragraph_count)   # kural anahtarı
+    \s*>=\s*
+    (?P<n>\d+)                             # minimum değer
+    ''',
+    re.VERBOSE,
+)
+_RE_TOTAL_SOURCES = re.compile(r'TOPLAM RAPOR.*?(\d+)', re.DOTALL)
+_RE_QUALITY_SCORE = re.compile(r'Toplam puan.*?\*\*(\d+)')
+_RE_DOMAIN_ROW = re.compile(r'\|\s*([\w.]+\.(?:gov\.tr|org\.tr|com|org))\s*\|')
+_RE_FORBIDDEN_ITEM = re.compile(r'❌\s*(.+?)(?:\n|$)')
+
+
 @dataclass
 class RuleSection:
     """Bir kural bölümü."""
@@ -57,26 +82,20 @@ class LoadedRules:
 
     def is_complete(self) -> bool:
         """Tüm kurallar yüklendi mi?"""
-        return all([
-            self.general_rules,
-            self.research_rules,
-            self.content_rules,
-            self.source_rules,
-            self.validation_rules,
-            self.quality_standards
-        ])
+        return (
+            self.general_rules is not None
+            and self.research_rules is not None
+            and self.content_rules is not None
+            and self.source_rules is not None
+            and self.validation_rules is not None
+            and self.quality_standards is not None
+        )
 
     def get_all_rules_text(self) -> str:
         """Tüm kuralları tek metin olarak döndür."""
         texts = []
-        for rule in [
-            self.general_rules,
-            self.research_rules,
-            self.content_rules,
-            self.source_rules,
-            self.validation_rules,
-            self.quality_standards
-        ]:
+        for attr in _RULE_ATTRS:
+            rule = getattr(self, attr)
             if rule:
                 texts.append(f"# {rule.title}\n\n{rule.raw_content}")
         return "\n\n---\n\n".join(texts)
@@ -276,22 +295,26 @@ class RulesLoader:
         if self.loaded_rules.content_rules:
             content = self.loaded_rules.content_rules.raw_content
 
-            # Kelime sayısı
-            match = re.search(r'word_count\s*>=\s*(\d+)', content)
-            if match:
-                self.loaded_rules.min_words_per_section = int(match.group(1))
-
-            # Paragraf sayısı
-            match = re.search(r'paragraph_count\s*>=\s*(\d+)', content)
-            if match:
-                self.loaded_rules.min_paragraphs_per_section = int(match.group(1))
+            # Kelime ve paragraf sayısı (ilk eşleşme geçerli)
+            seen = set()
+            for match in _RE_CONTENT_VALUES.finditer(content):
+                kind = match['kind']
+                if kind in seen:
+                    continue
+                seen.add(kind)
+                if kind == 'word_count':
+                    self.loaded_rules.min_words_per_section = int(match['n'])
+                else:
+                    self.loaded_rules.min_paragraphs_per_section = int(match['n'])
+                if len(seen) == 2:
+                    break
 
         # Kaynak kurallarından
         if self.loaded_rules.source_rules:
             content = self.loaded_rules.source_rules.raw_content
 
             # Toplam kaynak
-            match = re.search(r'TOPLAM RAPOR.*?(\d+)', content, re.DOTALL)
+            match = _RE_TOTAL_SOURCES.search(content)
             if match:
                 self.loaded_rules.min_total_sources = int(match.group(1))
 
@@ -300,7 +323,7 @@ class RulesLoader:
             content = self.loaded_rules.quality_standards.raw_content
 
             # Minimum puan
-            match = re.search(r'Toplam puan.*?\*\*(\d+)', content)
+            match = _RE_QUALITY_SCORE.search(content)
             if match:
                 self.loaded_rules.min_quality_score = int(match.group(1))
 
@@ -310,7 +333,7 @@ class RulesLoader:
         # Araştırma kurallarından ek domainler çıkar
         if self.loaded_rules.research_rules:
             content = self.loaded_rules.research_rules.raw_content
-            domains = re.findall(r'\|\s*([\w.]+\.(?:gov\.tr|org\.tr|com|org))\s*\|', content)
+            domains = _RE_DOMAIN_ROW.findall(content)
             for d in domains:
                 if d not in self.loaded_rules.trusted_domains:
                     self.loaded_rules.trusted_domains.append(d)
@@ -322,7 +345,7 @@ class RulesLoader:
                      self.loaded_rules.source_rules]:
             if rule:
                 # ❌ ile işaretli maddeleri bul
-                matches = re.findall(r'❌\s*(.+?)(?:\n|$)', rule.raw_content)
+                matches = _RE_FORBIDDEN_ITEM.findall(rule.raw_content)
                 forbidden.extend(matches)
 
         self.loaded_rules.forbidden_practices = list(set(forbidden))
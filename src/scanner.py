@@ -1,58 +1,57 @@
 """Dosya tarayıcı modülü - Klasördeki tüm desteklenen dosyaları bulur."""
 
+import json
+import logging
 import os
+import time
+from stat import S_ISDIR
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from functools import lru_cache, partial
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Callable, Iterator, ClassVar
+from typing import TYPE_CHECKING, BinaryIO, List, Dict, Any, Optional, Callable, Iterable, Iterator, ClassVar, Tuple, FrozenSet
 from dataclasses import dataclass, field
-from datetime import datetime
 
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
 # Type imports
-from .types import FileCategory, PathLike, ProgressCallback
+from .types import DATACLASS_SLOTS, FileCategory, FileInfo, PathLike, ProgressCallback, format_size
 
-console = Console()
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
+if TYPE_CHECKING:
+    from rich.console import Console
 
-@dataclass
-class FileInfo:
-    """Dosya bilgisi."""
-    path: str
-    name: str
-    extension: str
-    size: int
-    category: FileCategory
-    modified_time: datetime
+logger = logging.getLogger(__name__)
 
-    @property
-    def size_formatted(self) -> str:
-        """Okunabilir boyut."""
-        size = self.size
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024:
-                return f"{size:.1f} {unit}"
-            size /= 1024
-        return f"{size:.1f} TB"
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Dict'e cevir."""
-        return {
-            "path": self.path,
-            "name": self.name,
-            "extension": self.extension,
-            "size": self.size,
-            "size_formatted": self.size_formatted,
-            "category": self.category.value if isinstance(self.category, FileCategory) else self.category,
-            "modified_time": self.modified_time.isoformat()
-        }
+@lru_cache(maxsize=1)
+def _get_console() -> 'Console':
+    """Paylaşılan konsol (rich yalnızca ilk ihtiyaçta yüklenir)."""
+    from rich.console import Console
+    return Console()
+
+def _dumps_json(obj: Any) -> bytes:
+    """JSON'u UTF-8 bayt olarak serileştir."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
 
+# Sonuç listesindeki kategori sırası (değerlerin alfabetik sırası)
+_CATEGORY_ORDER: Tuple[FileCategory, ...] = tuple(sorted(FileCategory, key=attrgetter('value')))
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class ScanResult:
     """Tarama sonucu."""
     files: List[FileInfo] = field(default_factory=list)
     stats: Dict[str, int] = field(default_factory=dict)
+    stats_size: Dict[str, int] = field(default_factory=dict)
     total_size: int = 0
     scan_time: float = 0.0
 
@@ -63,21 +62,139 @@ class ScanResult:
 
     def get_files_by_category(self, category: FileCategory) -> List[FileInfo]:
         """Kategoriye gore dosyalari filtrele."""
-        cat_value = category.value if isinstance(category, FileCategory) else category
-        return [f for f in self.files if f.category == cat_value or
-                (isinstance(f.category, FileCategory) and f.category.value == cat_value)]
+        # FileCategory str tabanlı olduğundan tek eşitlik kontrolü yeterli
+        target = category.value if isinstance(category, FileCategory) else category
+        return [f for f in self.files if f.category == target]
+
+    def iter_dicts(self) -> Iterator[Dict[str, Any]]:
+        """Dosyaları tek tek dict olarak üret (tüm listeyi oluşturmadan)."""
+        for f in self.files:
+            yield f.to_dict()
+
+    def to_json(self, fp: BinaryIO) -> None:
+        """
+        to_dict ile aynı yapıyı JSON olarak binary dosyaya akış halinde yaz.
+
+        orjson kuruluysa onu, değilse standart json modülünü kullanır.
+        """
+        dumps = _dumps_json
+        fp.write(b'{"files":[')
+        for i, file_dict in enumerate(self.iter_dicts()):
+            if i:
+                fp.write(b',')
+            fp.write(dumps(file_dict))
+        fp.write(b'],"stats":' + dumps(self.stats))
+        fp.write(b',"stats_size":' + dumps(self.stats_size))
+        fp.write(b',"total_size":' + dumps(self.total_size))
+        fp.write(b',"total_files":' + dumps(self.total_files))
+        fp.write(b',"scan_time":' + dumps(self.scan_time) + b'}')
 
     def to_dict(self) -> Dict[str, Any]:
         """Dict'e cevir."""
         return {
-            "files": [f.to_dict() for f in self.files],
+            "files": list(self.iter_dicts()),
             "stats": self.stats,
+            "stats_size": self.stats_size,
             "total_size": self.total_size,
             "total_files": self.total_files,
             "scan_time": self.scan_time
         }
 
 
+class _ScanSnapshot:
+    """
+    Sıcak tarama önbelleği.
+
+    Her klasör için (dev, ino, mtime) parmak izi ile o klasörün doğrudan
+    dosyaları ve alt klasörleri JSON olarak saklanır. Parmak izi değişmeyen
+    klasörde scandir ve dosya stat çağrıları yapılmaz; alt klasörler yine
+    ziyaret edilip ayrı ayrı doğrulanır.
+
+    Not: POSIX'te klasör mtime'ı yalnızca alt öğe eklenip silindiğinde veya
+    yeniden adlandırıldığında değişir. Yerinde değiştirilen bir dosyanın
+    boyutu bir sonraki taramada önbellekteki değerle raporlanabilir.
+    """
+
+    VERSION: ClassVar[int] = 1
+
+    def __init__(self, path: Path, config_key: List[List[str]]) -> None:
+        self.path = path
+        self.config_key = config_key
+        self.previous: Dict[str, Dict[str, Any]] = {}
+        self.current: Dict[str, Dict[str, Any]] = {}
+
+    @classmethod
+    def load(cls, path: Path, config_key: List[List[str]]) -> '_ScanSnapshot':
+        """Önbelleği yükle; okunamazsa veya ayarlar farklıysa boş başla."""
+        snapshot = cls(path, config_key)
+        if not path.exists():
+            return snapshot
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == cls.VERSION and data.get('config') == config_key:
+                snapshot.previous = data['dirs']
+        except (json.JSONDecodeError, KeyError, AttributeError) as e:
+            logger.warning(f"Tarama onbellegi format hatasi: {path} - {e}")
+        except OSError as e:
+            logger.warning(f"Tarama onbellegi okunamadi: {path} - {e}")
+
+        return snapshot
+
+    def scan_dir(
+        self,
+        scan: Callable[[str], Tuple[List[FileInfo], List[str]]],
+        ext_to_category: Dict[str, FileCategory],
+        directory: str
+    ) -> Tuple[List[FileInfo], List[str]]:
+        """Klasör değişmediyse önbellekten, değiştiyse scan ile oku."""
+        try:
+            st = os.stat(directory)
+        except OSError:
+            return [], []
+
+        cached = self.previous.get(directory)
+        if (cached is not None
+                and cached['dev'] == st.st_dev
+                and cached['ino'] == st.st_ino
+                and cached['mtime_ns'] == st.st_mtime_ns):
+            files = [
+                FileInfo(path, name, extension, size, ext_to_category[extension], mtime)
+                for path, name, extension, size, mtime in cached['files']
+            ]
+            subdirs = cached['subdirs']
+            self.current[directory] = cached
+            return files, subdirs
+
+        # Parmak izi scandir'den önce alınır; okuma sırasında olan bir
+        # değişiklik bir sonraki taramada yeniden okumaya yol açar
+        files, subdirs = scan(directory)
+        self.current[directory] = {
+            'dev': st.st_dev,
+            'ino': st.st_ino,
+            'mtime_ns': st.st_mtime_ns,
+            'subdirs': subdirs,
+            'files': [
+                [f.path, f.name, f.extension, f.size, f.modified_time] for f in files
+            ],
+        }
+        return files, subdirs
+
+    def save(self) -> None:
+        """Bu taramada ziyaret edilen klasörleri kaydet."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'version': self.VERSION,
+                    'config': self.config_key,
+                    'dirs': self.current,
+                }, f, ensure_ascii=False)
+        except OSError as e:
+            logger.warning(f"Tarama onbellegi yazilamadi: {self.path} - {e}")
+
+
 class FileScanner:
     """Dosya tarayıcı sınıfı."""
 
@@ -89,42 +206,96 @@ class FileScanner:
         'image': ['.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.webp']
     }
 
-    def __init__(self, console_instance: Optional[Console] = None) -> None:
-        self.console: Console = console_instance or console
-        # Uzantıdan kategoriye map
-        self._ext_to_category: Dict[str, str] = {}
-        for category, extensions in self.EXTENSIONS.items():
-            for ext in extensions:
-                self._ext_to_category[ext] = category
+    # Alt ağacı hiç okunmadan atlanan klasör adları
+    IGNORED_DIRS: ClassVar[FrozenSet[str]] = frozenset({
+        'node_modules', '__pycache__', '.venv', '.git', 'venv', '.tox'
+    })
+
+    # İlerleme göstergesi en fazla her N dosyada veya bu aralıkta güncellenir
+    PROGRESS_EVERY: ClassVar[int] = 256
+    PROGRESS_INTERVAL: ClassVar[float] = 0.1
 
-    def get_supported_extensions(self) -> List[str]:
+    def __init__(
+        self,
+        console_instance: Optional['Console'] = None,
+        ignored_dirs: Optional[Iterable[str]] = None,
+        cache_path: Optional[PathLike] = None
+    ) -> None:
+        """
+        Args:
+            console_instance: Çıktı için kullanılacak konsol
+            ignored_dirs: Atlanacak klasör adları (varsayılan: IGNORED_DIRS)
+            cache_path: Sıcak tarama önbellek dosyası (JSON). Verilirse
+                değişmeyen klasörler tekrar okunmaz.
+        """
+        self._console: Optional['Console'] = console_instance
+        self._cache_path: Optional[Path] = Path(cache_path) if cache_path else None
+        self._ignored_dirs: FrozenSet[str] = (
+            frozenset(ignored_dirs) if ignored_dirs is not None else self.IGNORED_DIRS
+        )
+        # Uzantıdan kategoriye map (enum üyeleri önceden çözülür)
+        self._ext_to_category: Dict[str, FileCategory] = {
+            ext: FileCategory(category)
+            for category, extensions in self.EXTENSIONS.items()
+            for ext in extensions
+        }
+        self._supported_tuple: Tuple[str, ...] = tuple(self._ext_to_category)
+        # Uzantı kümesi sınırlı, sonuçlar örnek başına önbelleklenir
+        self._category_of: Callable[[str], FileCategory] = lru_cache(maxsize=64)(
+            self._lookup_category
+        )
+
+    @property
+    def console(self) -> 'Console':
+        """Çıktı konsolu."""
+        return self._console or _get_console()
+
+    def get_supported_extensions(self) -> Tuple[str, ...]:
         """Desteklenen tüm uzantıları döndür."""
-        extensions: List[str] = []
-        for ext_list in self.EXTENSIONS.values():
-            extensions.extend(ext_list)
-        return extensions
+        return self._supported_tuple
 
     def get_category(self, extension: str) -> FileCategory:
         """Uzantıdan kategori al."""
-        cat_str = self._ext_to_category.get(extension.lower(), 'unknown')
-        try:
-            return FileCategory(cat_str)
-        except ValueError:
-            return FileCategory.UNKNOWN
+        return self._category_of(extension)
 
-    def scan(self, input_path: PathLike, show_progress: bool = True) -> ScanResult:
-        """Klasörü tara ve desteklenen dosyaları bul."""
-        import time
+    def _lookup_category(self, extension: str) -> FileCategory:
+        """Önbelleksiz kategori çözümlemesi."""
+        return self._ext_to_category.get(extension.lower(), FileCategory.UNKNOWN)
+
+    def scan(
+        self,
+        input_path: PathLike,
+        show_progress: bool = True,
+        max_workers: int = 1
+    ) -> ScanResult:
+        """
+        Klasörü tara ve desteklenen dosyaları bul.
+
+        Args:
+            input_path: Taranacak klasör
+            show_progress: İlerleme göstergesi göster
+            max_workers: Eşzamanlı klasör okuyucu sayısı (1 = seri tarama)
+        """
         start_time = time.time()
 
         result = ScanResult(
-            stats={'pdf': 0, 'excel': 0, 'word': 0, 'image': 0, 'total': 0}
+            stats={'pdf': 0, 'excel': 0, 'word': 0, 'image': 0, 'total': 0},
+            stats_size={'pdf': 0, 'excel': 0, 'word': 0, 'image': 0}
         )
 
-        supported = self.get_supported_extensions()
         input_path = Path(input_path)
 
+        snapshot: Optional[_ScanSnapshot] = None
+        scan_dir = self._scan_dir
+        if self._cache_path is not None:
+            snapshot = _ScanSnapshot.load(self._cache_path, self._snapshot_key())
+            scan_dir = partial(snapshot.scan_dir, self._scan_dir, self._ext_to_category)
+
+        batches = self._iter_scandir(os.fspath(input_path), max_workers, scan_dir)
+
         if show_progress:
+            from rich.progress import Progress, SpinnerColumn, TextColumn
+
             with Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
@@ -132,82 +303,183 @@ class FileScanner:
                 transient=True
             ) as progress:
                 task = progress.add_task("Dosyalar taranıyor...", total=None)
-
-                for root, dirs, files in os.walk(input_path):
-                    # Gizli klasörleri atla
-                    dirs[:] = [d for d in dirs if not d.startswith('.')]
-
-                    for filename in files:
-                        # Gizli dosyaları atla
-                        if filename.startswith('.'):
-                            continue
-
-                        file_path = Path(root) / filename
-                        extension = file_path.suffix.lower()
-
-                        if extension in supported:
-                            try:
-                                stat = file_path.stat()
-                                category = self.get_category(extension)
-
-                                file_info = FileInfo(
-                                    path=str(file_path),
-                                    name=filename,
-                                    extension=extension,
-                                    size=stat.st_size,
-                                    category=category,
-                                    modified_time=datetime.fromtimestamp(stat.st_mtime)
-                                )
-
-                                result.files.append(file_info)
-                                result.stats[category] += 1
-                                result.stats['total'] += 1
-                                result.total_size += stat.st_size
-
-                                progress.update(task, description=f"Taranıyor: {filename[:40]}...")
-                            except (OSError, PermissionError):
-                                # Erişilemeyen dosyaları atla
-                                continue
+                self._collect(
+                    result,
+                    batches,
+                    lambda name: progress.update(task, description=f"Taranıyor: {name[:40]}...")
+                )
         else:
             # Progress bar olmadan tara
-            for root, dirs, files in os.walk(input_path):
-                dirs[:] = [d for d in dirs if not d.startswith('.')]
+            self._collect(result, batches)
 
-                for filename in files:
-                    if filename.startswith('.'):
-                        continue
-
-                    file_path = Path(root) / filename
-                    extension = file_path.suffix.lower()
-
-                    if extension in supported:
-                        try:
-                            stat = file_path.stat()
-                            category = self.get_category(extension)
-
-                            file_info = FileInfo(
-                                path=str(file_path),
-                                name=filename,
-                                extension=extension,
-                                size=stat.st_size,
-                                category=category,
-                                modified_time=datetime.fromtimestamp(stat.st_mtime)
-                            )
-
-                            result.files.append(file_info)
-                            result.stats[category] += 1
-                            result.stats['total'] += 1
-                            result.total_size += stat.st_size
-                        except (OSError, PermissionError):
-                            continue
-
-        # Dosyaları kategoriye göre sırala
-        result.files.sort(key=lambda f: (f.category, f.name))
+        if snapshot is not None:
+            snapshot.save()
 
         result.scan_time = time.time() - start_time
 
         return result
 
+    def _collect(
+        self,
+        result: ScanResult,
+        batches: Iterable[List[FileInfo]],
+        on_file: Optional[Callable[[str], None]] = None
+    ) -> None:
+        """
+        Bulunan dosyaları sonuca ekle, istatistikleri güncelle ve sırala.
+
+        Args:
+            result: Doldurulacak tarama sonucu
+            batches: Klasör başına taranan dosya listeleri
+            on_file: İlerleme göstergesi için dosya adıyla çağrılır; her
+                PROGRESS_EVERY dosyada veya PROGRESS_INTERVAL saniyede bir
+        """
+        # Kategori kovaları: sonda her kova isme göre sıralanıp birleştirilir.
+        # Sayaçlar yerel tutulur ve döngü sonunda sonuca bir kez yazılır.
+        buckets: Dict[FileCategory, List[FileInfo]] = defaultdict(list)
+        sizes: Dict[FileCategory, int] = defaultdict(int)
+        total_size = 0
+        seen = 0
+        every = self.PROGRESS_EVERY
+        interval = self.PROGRESS_INTERVAL
+        last_update = time.monotonic()
+
+        for batch in batches:
+            for file_info in batch:
+                category = file_info.category
+                size = file_info.size
+                buckets[category].append(file_info)
+                sizes[category] += size
+                total_size += size
+
+                if on_file is not None:
+                    seen += 1
+                    if seen % every == 0 or time.monotonic() - last_update >= interval:
+                        on_file(file_info.name)
+                        last_update = time.monotonic()
+
+        stats = result.stats
+        stats_size = result.stats_size
+        for category, bucket in buckets.items():
+            stats[category] = stats.get(category, 0) + len(bucket)
+            stats_size[category] = stats_size.get(category, 0) + sizes[category]
+        stats['total'] = stats.get('total', 0) + sum(map(len, buckets.values()))
+        result.total_size += total_size
+
+        # Dosyaları kategoriye, sonra isme göre sırala
+        by_name = attrgetter('name')
+        for category in _CATEGORY_ORDER:
+            bucket = buckets.get(category)
+            if bucket:
+                bucket.sort(key=by_name)
+                result.files.extend(bucket)
+
+    def _snapshot_key(self) -> List[List[str]]:
+        """Önbelleğin geçerli olduğu tarama ayarları."""
+        return [sorted(self._ext_to_category), sorted(self._ignored_dirs)]
+
+    def _iter_scandir(
+        self,
+        root: str,
+        max_workers: int = 1,
+        scan_dir: Optional[Callable[[str], Tuple[List[FileInfo], List[str]]]] = None
+    ) -> Iterator[List[FileInfo]]:
+        """
+        Dizin ağacını os.scandir ile gez ve klasör başına dosya listeleri üret.
+
+        Özyineleme yerine açık bir yığın kullanılır. max_workers > 1 ise
+        klasörler bir thread havuzunda eşzamanlı okunur; ağ dosya
+        sistemlerinde (SMB/NFS) her scandir çağrısının gecikmesi örtüşür.
+        """
+        scan_dir = scan_dir or self._scan_dir
+
+        if max_workers <= 1:
+            stack: List[str] = [root]
+            while stack:
+                files, subdirs = scan_dir(stack.pop())
+                stack.extend(subdirs)
+                if files:
+                    yield files
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = {executor.submit(scan_dir, root)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    files, subdirs = future.result()
+                    for subdir in subdirs:
+                        pending.add(executor.submit(scan_dir, subdir))
+                    if files:
+                        yield files
+
+    def _scan_dir(self, directory: str) -> Tuple[List[FileInfo], List[str]]:
+        """
+        Tek bir klasörü oku.
+
+        DirEntry üzerinden isim, yol ve stat bilgisi alınır; Path nesnesi
+        oluşturulmaz.
+
+        Returns:
+            (desteklenen dosyalar, inilecek alt klasörler)
+        """
+        ext_to_category = self._ext_to_category
+        ignored_dirs = self._ignored_dirs
+        files: List[FileInfo] = []
+        subdirs: List[str] = []
+
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            # Erişilemeyen klasörleri atla
+            return files, subdirs
+
+        with entries:
+            for entry in entries:
+                name = entry.name
+                # Gizli dosya ve klasörleri atla (isim hiçbir zaman boş değil)
+                if name[0] == '.':
+                    continue
+
+                try:
+                    # d_type ile cevaplanır, stat çağrısı yapılmaz; sembolik
+                    # bağlantılı klasörlere inilmez (os.walk ile aynı)
+                    if entry.is_dir(follow_symlinks=False):
+                        if name not in ignored_dirs:
+                            subdirs.append(entry.path)
+                        continue
+
+                    # Uzantı yalnızca dosya adından, tek dilimle alınır
+                    dot = name.rfind('.')
+                    if dot < 0:
+                        continue
+                    extension = name[dot:].lower()
+                    category = ext_to_category.get(extension)
+                    if category is None:
+                        continue
+
+                    # stat yalnızca eşleşen dosyalar için çağrılır; sembolik
+                    # bağlantı olmayan girdilerde DirEntry lstat sonucunu
+                    # önbelleğe aldığından ek çağrı yapılmaz
+                    stat = entry.stat()
+                    if S_ISDIR(stat.st_mode):
+                        # Klasöre işaret eden sembolik bağlantı
+                        continue
+                except OSError:
+                    # Erişilemeyen dosyaları atla
+                    continue
+
+                files.append(FileInfo(
+                    path=entry.path,
+                    name=name,
+                    extension=extension,
+                    size=stat.st_size,
+                    category=category,
+                    modified_time=stat.st_mtime
+                ))
+
+        return files, subdirs
+
     def get_files_by_category(
         self,
         result: ScanResult,
@@ -219,12 +491,7 @@ class FileScanner:
     @staticmethod
     def format_size(size_bytes: int) -> str:
         """Boyutu okunabilir formata çevir."""
-        size: float = float(size_bytes)
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024:
-                return f"{size:.1f} {unit}"
-            size /= 1024
-        return f"{size:.1f} TB"
+        return format_size(size_bytes)
 
     def print_summary(self, result: ScanResult):
         """Tarama özetini yazdır."""
@@ -252,8 +519,10 @@ class FileScanner:
         for category, name in category_names.items():
             count = result.stats.get(category, 0)
             if count > 0:
-                files = self.get_files_by_category(result, category)
-                size = sum(f.size for f in files)
+                size = result.stats_size.get(category)
+                if size is None:
+                    # Elle oluşturulmuş sonuçlarda boyut özeti olmayabilir
+                    size = sum(f.size for f in self.get_files_by_category(result, category))
                 table.add_row(name, str(count), self.format_size(size))
 
         table.add_section()
@@ -267,7 +536,11 @@ class FileScanner:
         self.console.print(f"[dim]Tarama süresi: {result.scan_time:.2f} saniye[/dim]")
 
 
-def scan_directory(input_path: str, show_progress: bool = True) -> ScanResult:
+def scan_directory(
+    input_path: str,
+    show_progress: bool = True,
+    max_workers: int = 1
+) -> ScanResult:
     """Ana fonksiyon - klasörü tara."""
     scanner = FileScanner()
-    return scanner.scan(input_path, show_progress)
+    return scanner.scan(input_path, show_progress, max_workers)
@@ -15,6 +15,11 @@ from datetime import datetime
 from pathlib import Path
 from enum import Enum, auto
 
+# dataclass slots ayari ve format_size utils'te tanimli (utils src/types.py'yi
+# import etmez)
+from .utils.common import DATACLASS_SLOTS  # noqa: F401
+from .utils.helpers import format_size  # noqa: F401
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # GENERIC TYPE VARIABLES
@@ -107,7 +112,6 @@ TableRow = List[str]
 TableData = List[TableRow]
 TableDict = Dict[str, Union[List[str], TableData]]
 
-
 # ═══════════════════════════════════════════════════════════════════════════════
 # PROTOCOLS (Duck Typing Interfaces)
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -278,7 +282,7 @@ class OperationResult(Generic[T]):
 # SPECIALIZED TYPES
 # ═══════════════════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FileInfo:
     """Dosya bilgisi."""
     path: str
@@ -286,17 +290,29 @@ class FileInfo:
     extension: str
     size: int
     category: FileCategory
-    modified_time: datetime
+    modified_time: float  # epoch saniyesi (st_mtime)
+
+    @property
+    def modified_dt(self) -> datetime:
+        """Degistirilme zamani (datetime olarak)."""
+        return datetime.fromtimestamp(self.modified_time)
 
     @property
     def size_formatted(self) -> str:
         """Okunabilir boyut."""
-        size = self.size
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024:
-                return f"{size:.1f} {unit}"
-            size /= 1024
-        return f"{size:.1f} TB"
+        return format_size(self.size)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Dict'e cevir."""
+        return {
+            "path": self.path,
+            "name": self.name,
+            "extension": self.extension,
+            "size": self.size,
+            "size_formatted": self.size_formatted,
+            "category": self.category.value if isinstance(self.category, FileCategory) else self.category,
+            "modified_time": self.modified_dt.isoformat()
+        }
 
 
 @dataclass
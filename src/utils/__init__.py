@@ -37,7 +37,7 @@ from .retry_helper import (
 # Yeni: Common Utilities
 from .common import (
     # Text utilities
-    truncate_text, clean_text, extract_first_sentence,
+    truncate_text, clean_text, clean_text_batch, extract_first_sentence,
     word_count, paragraph_count, normalize_whitespace,
     # Number utilities
     format_number, format_percentage, format_currency, safe_divide,
@@ -78,7 +78,7 @@ __all__ = [
     # Retry Helper
     'retry_with_backoff', 'retry_api_call', 'RetryableAPIClient',
     # Common - Text
-    'truncate_text', 'clean_text', 'extract_first_sentence',
+    'truncate_text', 'clean_text', 'clean_text_batch', 'extract_first_sentence',
     'word_count', 'paragraph_count', 'normalize_whitespace',
     # Common - Number
     'format_number', 'format_percentage', 'format_currency', 'safe_divide',
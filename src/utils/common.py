@@ -5,23 +5,53 @@ Ortak yardimci fonksiyonlar ve siniflar.
 Kod tekrarini onlemek icin merkezi utility'ler.
 """
 
+import os
 import re
+import sys
 import time
 import hashlib
 import logging
 from typing import (
     TypeVar, Generic, Optional, Any, Dict, List, Union,
-    Callable, Tuple, Iterator
+    Callable, Tuple, Iterator, Iterable, Sequence
 )
 from dataclasses import dataclass, field
-from functools import wraps
+from functools import lru_cache, wraps
+from itertools import count, islice
 from datetime import datetime
 from pathlib import Path
 
+# blake3 import (opsiyonel, SIMD hizlandirmali hash)
+try:
+    from blake3 import blake3 as _blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    _blake3 = None
+    BLAKE3_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+# Cok sayida uretilen dataclass'lar icin __slots__ (dataclass slots=True
+# Python 3.10+ gerektirir; 3.9'da bos kalir). src/types.py de buradan alir.
+DATACLASS_SLOTS: Dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Sik kullanilan metin desenleri (modul yuklenirken bir kez derlenir)
+_MULTISPACE_RE = re.compile(r' +')
+_MULTINEWLINE_RE = re.compile(r'\n{3,}')
+_FIRST_SENTENCE_RE = re.compile(r'^[^.!?]*[.!?]')
+
+# Turkce sayi formati ceviri tablolari: 1,234.56 -> 1.234,56
+_TR_SWAP = str.maketrans({',': '.', '.': ','})
+_COMMA_TO_DOT = str.maketrans({',': '.'})
+
+_FILE_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# generate_unique_filename icin zaman damgasi donusumu ve surec ici sayac
+_FILENAME_TS = str.maketrans({'-': None, ':': None, ' ': '_'})
+_UNIQUE_COUNTER = count()
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # TEXT UTILITIES
@@ -38,11 +68,20 @@ def clean_text(text: str) -> str:
     """Metni temizle - fazla bosluklar, null karakterler."""
     if not text:
         return ""
-    # Null karakterleri kaldir
-    text = text.replace('\x00', '')
-    # Fazla bosluklari tek bosluga indir
-    text = re.sub(r'\s+', ' ', text)
-    return text.strip()
+    # Null karakterleri kaldir, fazla bosluklari tek bosluga indir.
+    # str.split() \s ile ayni bosluk kumesini kullanir ve bastaki/sondaki
+    # bosluklari da atar; regex motorundan belirgin sekilde hizlidir.
+    return ' '.join(text.replace('\x00', '').split())
+
+
+def clean_text_batch(texts: Iterable[Optional[str]]) -> List[str]:
+    """
+    Birden fazla metni clean_text ile ayni kurallarla temizle.
+
+    Temizlik dongu icinde dogrudan yapilir; metin basina ek fonksiyon
+    cagrisi olmaz.
+    """
+    return [' '.join(t.replace('\x00', '').split()) if t else "" for t in texts]
 
 
 def extract_first_sentence(text: str, max_length: int = 200) -> str:
@@ -50,7 +89,7 @@ def extract_first_sentence(text: str, max_length: int = 200) -> str:
     if not text:
         return ""
     # Cumle sonu isaretleri
-    match = re.search(r'^[^.!?]*[.!?]', text)
+    match = _FIRST_SENTENCE_RE.search(text)
     if match:
         sentence = match.group(0).strip()
         return truncate_text(sentence, max_length)
@@ -79,9 +118,9 @@ def normalize_whitespace(text: str) -> str:
     # Tab -> space
     text = text.replace('\t', ' ')
     # Birden fazla space -> tek space
-    text = re.sub(r' +', ' ', text)
+    text = _MULTISPACE_RE.sub(' ', text)
     # Birden fazla newline -> iki newline (paragraf ayirici)
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = _MULTINEWLINE_RE.sub('\n\n', text)
     return text.strip()
 
 
@@ -89,18 +128,25 @@ def normalize_whitespace(text: str) -> str:
 # NUMBER UTILITIES
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Locale basina bir kez olusturulan formatlayicilar; bilinmeyen locale "en" gibi
+_INT_FORMATTERS: Dict[str, Callable[[int], str]] = {
+    "tr": lambda v: f"{v:,}".translate(_COMMA_TO_DOT),
+    "en": lambda v: f"{v:,}",
+}
+_FLOAT_FORMATTERS: Dict[str, Callable[[float], str]] = {
+    # 1,234.56 -> 1.234,56
+    "tr": lambda v: f"{v:,.2f}".translate(_TR_SWAP),
+    "en": lambda v: f"{v:,.2f}",
+}
+
+
 def format_number(value: Union[int, float], locale: str = "tr") -> str:
     """Sayiyi locale'e gore formatla."""
-    if isinstance(value, int):
-        if locale == "tr":
-            return f"{value:,}".replace(",", ".")
-        return f"{value:,}"
-    else:
-        if locale == "tr":
-            formatted = f"{value:,.2f}"
-            # 1,234.56 -> 1.234,56
-            return formatted.replace(",", "X").replace(".", ",").replace("X", ".")
-        return f"{value:,.2f}"
+    formatters = _INT_FORMATTERS if isinstance(value, int) else _FLOAT_FORMATTERS
+    formatter = formatters.get(locale)
+    if formatter is None:
+        formatter = formatters["en"]
+    return formatter(value)
 
 
 def format_percentage(value: float, decimals: int = 1) -> str:
@@ -141,16 +187,19 @@ def format_file_size(size_bytes: int) -> str:
     """Dosya boyutunu okunabilir formata cevir."""
     if size_bytes < 0:
         return "0 B"
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.1f} PB"
+    if size_bytes < 1024:
+        return f"{size_bytes:.1f} B"
+    # Birim indeksi bit uzunlugundan: her 2**10 bir birim
+    idx = min((int(size_bytes).bit_length() - 1) // 10, 5)
+    return f"{size_bytes / (1 << (idx * 10)):.1f} {_FILE_SIZE_UNITS[idx]}"
 
 
+@lru_cache(maxsize=4096)
 def get_file_extension(file_path: Union[str, Path]) -> str:
     """Dosya uzantisini al (lowercase)."""
-    return Path(file_path).suffix.lower()
+    # Path.suffix ile ayni sonuc: sondaki ayirici yok sayilir, "dosya." -> ""
+    ext = os.path.splitext(os.fspath(file_path).rstrip(os.sep))[1]
+    return "" if ext == "." else ext.lower()
 
 
 def generate_unique_filename(
@@ -159,17 +208,17 @@ def generate_unique_filename(
     output_dir: Union[str, Path] = "."
 ) -> Path:
     """Benzersiz dosya adi olustur."""
-    output_dir = Path(output_dir)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{base_name}_{timestamp}{extension}"
-    return output_dir / filename
+    # "2024-01-31 12:00:00" -> "20240131_120000"; sayac ayni saniyede
+    # uretilen adlarin cakismasini onler
+    timestamp = get_timestamp().translate(_FILENAME_TS)
+    filename = f"{base_name}_{timestamp}_{next(_UNIQUE_COUNTER):08x}{extension}"
+    return Path(output_dir) / filename
 
 
 def ensure_directory(path: Union[str, Path]) -> Path:
     """Dizinin var olmasini sagla."""
-    path = Path(path)
-    path.mkdir(parents=True, exist_ok=True)
-    return path
+    os.makedirs(path, exist_ok=True)
+    return path if isinstance(path, Path) else Path(path)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -177,21 +226,43 @@ def ensure_directory(path: Union[str, Path]) -> Path:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 def generate_hash(content: str, algorithm: str = "md5") -> str:
-    """Icerik hash'i olustur."""
+    """
+    Icerik hash'i olustur.
+
+    algorithm="blake3" blake3 paketini gerektirir; her ortamda ayni hizli
+    ozet icin algorithm="blake2b" (32 karakter) kullanilabilir.
+    """
+    data = content.encode()
     if algorithm == "md5":
-        return hashlib.md5(content.encode()).hexdigest()
+        return hashlib.md5(data).hexdigest()
     elif algorithm == "sha256":
-        return hashlib.sha256(content.encode()).hexdigest()
+        return hashlib.sha256(data).hexdigest()
+    elif algorithm == "blake2b":
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+    elif algorithm == "blake3":
+        if not BLAKE3_AVAILABLE:
+            raise ImportError("blake3 kütüphanesi yüklü değil. 'pip install blake3' komutunu çalıştırın.")
+        return _blake3(data).hexdigest(length=16)
     else:
-        return hashlib.md5(content.encode()).hexdigest()
+        return hashlib.md5(data).hexdigest()
 
 
 def generate_cache_key(*args: Any, **kwargs: Any) -> str:
-    """Cache anahtari olustur."""
-    key_parts = [str(arg) for arg in args]
-    key_parts.extend(f"{k}={v}" for k, v in sorted(kwargs.items()))
-    combined = ":".join(key_parts)
-    return generate_hash(combined)
+    """
+    Cache anahtari olustur.
+
+    Parcalar birlestirilmeden dogrudan blake2b hasher'ina yazilir;
+    sonuc 32 karakterlik hex ozettir.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    update = hasher.update
+    for arg in args:
+        update(str(arg).encode())
+        update(b":")
+    for k, v in sorted(kwargs.items()):
+        update(f"{k}={v}".encode())
+        update(b":")
+    return hasher.hexdigest()
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -210,14 +281,28 @@ def format_duration(seconds: float) -> str:
         return f"{hours:.1f}h"
 
 
+# Son formatlanan saniye: [epoch saniyesi, "YYYY-MM-DD HH:MM:SS"]
+_TS_CACHE: List[Any] = [-1, ""]
+
+
 def get_timestamp() -> str:
-    """Simdi icin timestamp al."""
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    """
+    Simdi icin timestamp al.
+
+    strftime sadece saniye degistiginde cagrilir; ayni saniye icindeki
+    cagrilar onbellekteki metni dondurur.
+    """
+    now = int(time.time())
+    cache = _TS_CACHE
+    if cache[0] != now:
+        cache[1] = datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M:%S")
+        cache[0] = now
+    return cache[1]
 
 
 def get_date_str() -> str:
     """Bugunku tarihi al."""
-    return datetime.now().strftime("%Y-%m-%d")
+    return get_timestamp()[:10]
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -225,13 +310,14 @@ def get_date_str() -> str:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 def timed(func: Callable[..., T]) -> Callable[..., Tuple[T, float]]:
-    """Fonksiyon suresini olc."""
+    """Fonksiyon suresini olc (saniye, monoton saat)."""
+    perf_counter_ns = time.perf_counter_ns
+
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Tuple[T, float]:
-        start = time.time()
+        start = perf_counter_ns()
         result = func(*args, **kwargs)
-        duration = time.time() - start
-        return result, duration
+        return result, (perf_counter_ns() - start) * 1e-9
     return wrapper
 
 
@@ -241,19 +327,24 @@ def log_call(
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """Fonksiyon cagrisini logla."""
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        func_name = func.__name__
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
-            func_name = func.__name__
-            if include_args:
-                logger.log(level, f"Calling {func_name} with args={args}, kwargs={kwargs}")
-            else:
-                logger.log(level, f"Calling {func_name}")
+            # Seviye kapaliysa args/kwargs repr'i hic uretilmez
+            enabled = logger.isEnabledFor(level)
+            if enabled:
+                if include_args:
+                    logger.log(level, "Calling %s with args=%r, kwargs=%r", func_name, args, kwargs)
+                else:
+                    logger.log(level, "Calling %s", func_name)
             try:
                 result = func(*args, **kwargs)
-                logger.log(level, f"{func_name} completed successfully")
+                if enabled:
+                    logger.log(level, "%s completed successfully", func_name)
                 return result
             except Exception as e:
-                logger.error(f"{func_name} failed: {e}")
+                logger.error("%s failed: %s", func_name, e)
                 raise
         return wrapper
     return decorator
@@ -278,9 +369,9 @@ def deprecated(reason: str = "") -> Callable[[Callable[..., T]], Callable[..., T
 # DATA STRUCTURES
 # ═══════════════════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Result(Generic[T]):
-    """Generic sonuc wrapper."""
+    """Generic sonuc wrapper (degistirilemez)."""
     success: bool
     data: Optional[T] = None
     error: Optional[str] = None
@@ -297,7 +388,7 @@ class Result(Generic[T]):
         return cls(success=False, error=error)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BatchResult(Generic[T]):
     """Toplu islem sonucu."""
     total: int
@@ -318,10 +409,23 @@ class BatchResult(Generic[T]):
 # ITERATION UTILITIES
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def chunked(iterable: List[T], size: int) -> Iterator[List[T]]:
-    """Listeyi belirli boyutta parcalara bol."""
-    for i in range(0, len(iterable), size):
-        yield iterable[i:i + size]
+def chunked(iterable: Iterable[T], size: int) -> Iterator[List[T]]:
+    """
+    Listeyi belirli boyutta parcalara bol.
+
+    Liste/tuple gibi sequence'ler dilimlenir; generator gibi diger
+    iterable'lar islice ile tek geciste, bellege tamamen alinmadan bolunur.
+    """
+    if isinstance(iterable, Sequence):
+        for i in range(0, len(iterable), size):
+            yield iterable[i:i + size]
+        return
+    it = iter(iterable)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
 
 
 def first_or_none(iterable: List[T]) -> Optional[T]:
@@ -331,14 +435,18 @@ def first_or_none(iterable: List[T]) -> Optional[T]:
 
 def unique_by(
     items: List[T],
-    key: Callable[[T], Any]
+    key: Optional[Callable[[T], Any]] = None
 ) -> List[T]:
-    """Key'e gore benzersiz elemanlar."""
-    seen: set = set()
-    result: List[T] = []
+    """
+    Key'e gore benzersiz elemanlar.
+
+    Her key icin ilk gorulen eleman tutulur, sira korunur.
+    key verilmezse elemanlarin kendisi (hashable olmali) kullanilir.
+    """
+    if key is None:
+        return list(dict.fromkeys(items))
+    unique: Dict[Any, T] = {}
+    setdefault = unique.setdefault
     for item in items:
-        k = key(item)
-        if k not in seen:
-            seen.add(k)
-            result.append(item)
-    return result
+        setdefault(key(item), item)
+    return list(unique.values())
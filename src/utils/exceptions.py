@@ -8,11 +8,25 @@ Her exception kategorisi icin ayri sinif tanimlanmistir.
 from typing import Optional, Dict, Any
 
 
+def _restore_error(cls: type, args: tuple, state: Dict[str, Any]) -> 'ReportGeneratorError':
+    """Pickle'dan exception'i __init__ cagirmadan geri olustur."""
+    error = cls.__new__(cls, *args)
+    error.args = args
+    for name, value in state.items():
+        setattr(error, name, value)
+    return error
+
+
 class ReportGeneratorError(Exception):
     """
     Tum uygulama hatalarinin temel sinifi.
+
+    Alanlar __slots__ ile tutulur; instance __dict__'i ancak ek bir
+    attribute atanirsa olusur.
     """
 
+    __slots__ = ('message', 'code', 'details')
+
     def __init__(
         self,
         message: str,
@@ -24,6 +38,13 @@ class ReportGeneratorError(Exception):
         self.details = details or {}
         super().__init__(self.message)
 
+    def __reduce__(self):
+        # BaseException.__reduce__ sadece __dict__'i tasir; slot alanlari
+        # pickle/copy sirasinda kaybolmasin diye state acikca veriliyor.
+        state = {name: getattr(self, name) for name in ReportGeneratorError.__slots__}
+        state.update(getattr(self, '__dict__', {}))
+        return (_restore_error, (self.__class__, self.args, state))
+
     def to_dict(self) -> Dict[str, Any]:
         """Exception'i dict'e cevir."""
         return {
@@ -40,12 +61,14 @@ class ReportGeneratorError(Exception):
 
 class FileOperationError(ReportGeneratorError):
     """Dosya islemleri hatalari."""
-    pass
+    __slots__ = ()
 
 
 class FileNotFoundError(FileOperationError):
     """Dosya bulunamadi hatasi."""
 
+    __slots__ = ()
+
     def __init__(self, path: str):
         super().__init__(
             message=f"Dosya bulunamadi: {path}",
@@ -57,6 +80,8 @@ class FileNotFoundError(FileOperationError):
 class FileReadError(FileOperationError):
     """Dosya okuma hatasi."""
 
+    __slots__ = ()
+
     def __init__(self, path: str, reason: str = ""):
         super().__init__(
             message=f"Dosya okunamadi: {path}" + (f" - {reason}" if reason else ""),
@@ -68,6 +93,8 @@ class FileReadError(FileOperationError):
 class FileWriteError(FileOperationError):
     """Dosya yazma hatasi."""
 
+    __slots__ = ()
+
     def __init__(self, path: str, reason: str = ""):
         super().__init__(
             message=f"Dosya yazilamadi: {path}" + (f" - {reason}" if reason else ""),
@@ -79,6 +106,8 @@ class FileWriteError(FileOperationError):
 class FileSizeError(FileOperationError):
     """Dosya boyutu hatasi."""
 
+    __slots__ = ()
+
     def __init__(self, path: str, size_mb: float, max_size_mb: int):
         super().__init__(
             message=f"Dosya cok buyuk: {path} ({size_mb:.1f}MB > {max_size_mb}MB)",
@@ -93,12 +122,14 @@ class FileSizeError(FileOperationError):
 
 class ParsingError(ReportGeneratorError):
     """Parsing hatalari."""
-    pass
+    __slots__ = ()
 
 
 class PDFParsingError(ParsingError):
     """PDF parse hatasi."""
 
+    __slots__ = ()
+
     def __init__(self, path: str, reason: str = ""):
         super().__init__(
             message=f"PDF parse edilemedi: {path}" + (f" - {reason}" if reason else ""),
@@ -110,6 +141,8 @@ class PDFParsingError(ParsingError):
 class ExcelParsingError(ParsingError):
     """Excel parse hatasi."""
 
+    __slots__ = ()
+
     def __init__(self, path: str, sheet: str = "", reason: str = ""):
         super().__init__(
             message=f"Excel parse edilemedi: {path}" + (f" [{sheet}]" if sheet else "") + (f" - {reason}" if reason else ""),
@@ -121,6 +154,8 @@ class ExcelParsingError(ParsingError):
 class NumberParsingError(ParsingError):
     """Sayi parse hatasi."""
 
+    __slots__ = ()
+
     def __init__(self, value: str, expected_format: str = ""):
         super().__init__(
             message=f"Sayi parse edilemedi: '{value}'" + (f" (beklenen format: {expected_format})" if expected_format else ""),
@@ -132,6 +167,8 @@ class NumberParsingError(ParsingError):
 class TableParsingError(ParsingError):
     """Tablo parse hatasi."""
 
+    __slots__ = ()
+
     def __init__(self, reason: str = ""):
         super().__init__(
             message=f"Tablo parse edilemedi" + (f": {reason}" if reason else ""),
@@ -146,12 +183,14 @@ class TableParsingError(ParsingError):
 
 class APIError(ReportGeneratorError):
     """API hatalari."""
-    pass
+    __slots__ = ()
 
 
 class APIConnectionError(APIError):
     """API baglanti hatasi."""
 
+    __slots__ = ()
+
     def __init__(self, service: str, reason: str = ""):
         super().__init__(
             message=f"API'ye baglanamadi: {service}" + (f" - {reason}" if reason else ""),
@@ -163,6 +202,8 @@ class APIConnectionError(APIError):
 class APITimeoutError(APIError):
     """API timeout hatasi."""
 
+    __slots__ = ()
+
     def __init__(self, service: str, timeout_seconds: int):
         super().__init__(
             message=f"API istegi zaman asimina ugradi: {service} ({timeout_seconds}s)",
@@ -174,6 +215,8 @@ class APITimeoutError(APIError):
 class APIRateLimitError(APIError):
     """API rate limit hatasi."""
 
+    __slots__ = ()
+
     def __init__(self, service: str, retry_after: Optional[int] = None):
         super().__init__(
             message=f"API rate limit asildi: {service}" + (f" (tekrar dene: {retry_after}s)" if retry_after else ""),
@@ -185,6 +228,8 @@ class APIRateLimitError(APIError):
 class APIAuthenticationError(APIError):
     """API authentication hatasi."""
 
+    __slots__ = ()
+
     def __init__(self, service: str):
         super().__init__(
             message=f"API kimlik dogrulamasi basarisiz: {service}",
@@ -196,6 +241,8 @@ class APIAuthenticationError(APIError):
 class APIResponseError(APIError):
     """API response hatasi."""
 
+    __slots__ = ()
+
     def __init__(self, service: str, status_code: int, response: str = ""):
         super().__init__(
             message=f"API hatali yanit: {service} (HTTP {status_code})",
@@ -210,12 +257,14 @@ class APIResponseError(APIError):
 
 class ValidationError(ReportGeneratorError):
     """Validation hatalari."""
-    pass
+    __slots__ = ()
 
 
 class InputValidationError(ValidationError):
     """Input validation hatasi."""
 
+    __slots__ = ()
+
     def __init__(self, field: str, value: Any, reason: str = ""):
         super().__init__(
             message=f"Gecersiz input: {field}" + (f" - {reason}" if reason else ""),
@@ -227,6 +276,8 @@ class InputValidationError(ValidationError):
 class ContentValidationError(ValidationError):
     """Icerik validation hatasi."""
 
+    __slots__ = ()
+
     def __init__(self, section: str, issue: str):
         super().__init__(
             message=f"Icerik dogrulamasi basarisiz: {section} - {issue}",
@@ -238,6 +289,8 @@ class ContentValidationError(ValidationError):
 class QualityValidationError(ValidationError):
     """Kalite validation hatasi."""
 
+    __slots__ = ()
+
     def __init__(self, score: float, min_score: float):
         super().__init__(
             message=f"Kalite puani yetersiz: {score:.1%} < {min_score:.1%}",
@@ -252,12 +305,14 @@ class QualityValidationError(ValidationError):
 
 class SecurityError(ReportGeneratorError):
     """Guvenlik hatalari."""
-    pass
+    __slots__ = ()
 
 
 class PathTraversalError(SecurityError):
     """Path traversal hatasi."""
 
+    __slots__ = ()
+
     def __init__(self, path: str):
         super().__init__(
             message=f"Guvenlik ihlali: Path traversal tespit edildi",
@@ -269,6 +324,8 @@ class PathTraversalError(SecurityError):
 class PromptInjectionError(SecurityError):
     """Prompt injection hatasi."""
 
+    __slots__ = ()
+
     def __init__(self, pattern: str = ""):
         super().__init__(
             message="Guvenlik ihlali: Prompt injection tespit edildi",
@@ -280,6 +337,8 @@ class PromptInjectionError(SecurityError):
 class URLValidationError(SecurityError):
     """URL validation hatasi."""
 
+    __slots__ = ()
+
     def __init__(self, url: str, reason: str = ""):
         super().__init__(
             message=f"Gecersiz URL" + (f": {reason}" if reason else ""),
@@ -294,12 +353,14 @@ class URLValidationError(SecurityError):
 
 class ConfigurationError(ReportGeneratorError):
     """Konfigurasyon hatalari."""
-    pass
+    __slots__ = ()
 
 
 class RulesLoadError(ConfigurationError):
     """Kural yukleme hatasi."""
 
+    __slots__ = ()
+
     def __init__(self, rule_file: str, reason: str = ""):
         super().__init__(
             message=f"Kural dosyasi yuklenemedi: {rule_file}" + (f" - {reason}" if reason else ""),
@@ -311,6 +372,8 @@ class RulesLoadError(ConfigurationError):
 class TemplateLoadError(ConfigurationError):
     """Template yukleme hatasi."""
 
+    __slots__ = ()
+
     def __init__(self, template: str, reason: str = ""):
         super().__init__(
             message=f"Template yuklenemedi: {template}" + (f" - {reason}" if reason else ""),
@@ -322,6 +385,8 @@ class TemplateLoadError(ConfigurationError):
 class ConfigFileError(ConfigurationError):
     """Config dosyasi hatasi."""
 
+    __slots__ = ()
+
     def __init__(self, config_file: str, reason: str = ""):
         super().__init__(
             message=f"Config dosyasi okunamadi: {config_file}" + (f" - {reason}" if reason else ""),
@@ -336,12 +401,14 @@ class ConfigFileError(ConfigurationError):
 
 class CacheError(ReportGeneratorError):
     """Cache hatalari."""
-    pass
+    __slots__ = ()
 
 
 class CacheReadError(CacheError):
     """Cache okuma hatasi."""
 
+    __slots__ = ()
+
     def __init__(self, key: str, reason: str = ""):
         super().__init__(
             message=f"Cache okunamadi: {key}" + (f" - {reason}" if reason else ""),
@@ -353,6 +420,8 @@ class CacheReadError(CacheError):
 class CacheWriteError(CacheError):
     """Cache yazma hatasi."""
 
+    __slots__ = ()
+
     def __init__(self, key: str, reason: str = ""):
         super().__init__(
             message=f"Cache yazilamadi: {key}" + (f" - {reason}" if reason else ""),
@@ -367,12 +436,14 @@ class CacheWriteError(CacheError):
 
 class GenerationError(ReportGeneratorError):
     """Uretim hatalari."""
-    pass
+    __slots__ = ()
 
 
 class ContentGenerationError(GenerationError):
     """Icerik uretim hatasi."""
 
+    __slots__ = ()
+
     def __init__(self, section: str, reason: str = ""):
         super().__init__(
             message=f"Icerik uretilemedi: {section}" + (f" - {reason}" if reason else ""),
@@ -384,6 +455,8 @@ class ContentGenerationError(GenerationError):
 class DocumentGenerationError(GenerationError):
     """Dokuman uretim hatasi."""
 
+    __slots__ = ()
+
     def __init__(self, format: str, reason: str = ""):
         super().__init__(
             message=f"Dokuman uretilemedi ({format})" + (f": {reason}" if reason else ""),
@@ -395,6 +468,8 @@ class DocumentGenerationError(GenerationError):
 class ChartGenerationError(GenerationError):
     """Grafik uretim hatasi."""
 
+    __slots__ = ()
+
     def __init__(self, chart_type: str, reason: str = ""):
         super().__init__(
             message=f"Grafik uretilemedi ({chart_type})" + (f": {reason}" if reason else ""),
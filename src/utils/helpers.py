@@ -1,44 +1,63 @@
 """Yardımcı fonksiyonlar."""
 
 import os
+import copy
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
+# libyaml varsa C parser, yoksa saf Python SafeLoader
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+from .common import get_file_extension  # noqa: F401 (geriye uyumluluk)
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# Dosya adında geçersiz karakterler -> '_'
+_SANITIZE_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+
+
+@lru_cache(maxsize=64)
+def _parse_yaml(file_path: str, mtime_ns: int, size: int) -> Any:
+    """YAML dosyasını parse et; (yol, mtime, boyut) değişmedikçe önbellekten."""
+    with open(file_path, 'rb') as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
 
 def load_yaml(file_path: str) -> Dict[str, Any]:
-    """YAML dosyasını yükle."""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+    """
+    YAML dosyasını yükle.
+
+    Değişmemiş dosyalar yeniden parse edilmez; çağırana her seferinde
+    bağımsız bir kopya döner.
+    """
+    path = os.fspath(file_path)
+    st = os.stat(path)
+    return copy.deepcopy(_parse_yaml(path, st.st_mtime_ns, st.st_size))
 
 
 def ensure_dir(path: str) -> Path:
     """Klasörün var olduğundan emin ol, yoksa oluştur."""
-    dir_path = Path(path)
-    dir_path.mkdir(parents=True, exist_ok=True)
-    return dir_path
+    os.makedirs(path, exist_ok=True)
+    return path if isinstance(path, Path) else Path(path)
 
 
 def format_size(size_bytes: int) -> str:
     """Dosya boyutunu okunabilir formata çevir."""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.1f} TB"
-
-
-def get_file_extension(file_path: str) -> str:
-    """Dosya uzantısını al (küçük harf)."""
-    return Path(file_path).suffix.lower()
+    if size_bytes < 1024:
+        return f"{size_bytes:.1f} B"
+    # Birim indeksi bit uzunluğundan: her 2**10 bir birim
+    idx = min((int(size_bytes).bit_length() - 1) // 10, 4)
+    return f"{size_bytes / (1 << (idx * 10)):.1f} {_SIZE_UNITS[idx]}"
 
 
 def sanitize_filename(filename: str) -> str:
     """Dosya adını güvenli hale getir."""
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
-    return filename
+    return filename.translate(_SANITIZE_TABLE)
 
 
 def truncate_text(text: str, max_length: int = 100) -> str:
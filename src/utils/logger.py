@@ -9,17 +9,32 @@ Ozellikler:
 - Opsiyonel JSON formati
 """
 
+import atexit
+import copy
 import logging
+import os
+import queue
 import sys
+import threading
 import time
 import json
+import weakref
+from collections import deque
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, List, Tuple
 from functools import wraps
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, astuple
 from contextlib import contextmanager
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+
+from .common import DATACLASS_SLOTS
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Rich console
 from rich.logging import RichHandler
@@ -28,6 +43,18 @@ from rich.console import Console
 console = Console()
 
 
+def _dumps_json(obj: Any, indent: bool = False) -> str:
+    """JSON metni uret; orjson varsa onu kullan."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(obj, option=option).decode('utf-8')
+        except TypeError:
+            # orjson'un desteklemedigi tipler (orn. 64 bitten buyuk int) icin json
+            pass
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
+
+
 @dataclass
 class LogConfig:
     """Logger konfigurasyonu."""
@@ -42,16 +69,149 @@ class LogConfig:
     include_module: bool = True
     max_file_size_mb: int = 10
     backup_count: int = 5
+    async_queue: bool = False  # Handler I/O'sunu arka plan thread'ine tasi
+    metrics_ring_size: int = 10000  # Bellekte tutulan en fazla metrik sayisi
 
 
-@dataclass
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    Buyuk tamponla yazan RotatingFileHandler.
+
+    Her kayitta flush yapilmaz: ERROR ve ustu kayitlar hemen, digerleri en
+    gec FLUSH_INTERVAL saniye icinde diske yazilir. Disaridan cagrilan
+    flush() ve close() her zaman tamponu bosaltir. Dosya boyutu rollover
+    icin seek/tell yerine yazilan bayt sayaciyla izlenir; seek tamponu
+    her kayitta bosaltirdi.
+    """
+
+    FLUSH_INTERVAL = 1.0
+
+    _live: 'weakref.WeakSet[BufferedRotatingFileHandler]' = weakref.WeakSet()
+    _flusher: Optional[threading.Thread] = None
+    _flusher_lock = threading.Lock()
+
+    def __init__(self, filename, *args, buffer_size: int = 64 * 1024, **kwargs):
+        self.buffer_size = buffer_size
+        self._emitting = False
+        self._urgent = False
+        self._last_flush = time.monotonic()
+        self._size = 0
+        self._pending = 0
+        super().__init__(filename, *args, **kwargs)
+        BufferedRotatingFileHandler._live.add(self)
+        BufferedRotatingFileHandler._ensure_flusher()
+
+    def _open(self):
+        stream = open(
+            self.baseFilename, self.mode, buffering=self.buffer_size,
+            encoding=self.encoding, errors=self.errors
+        )
+        self._size = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        # RotatingFileHandler ile ayni karar, ama stream.seek/tell cagrilmaz
+        if os.path.exists(self.baseFilename) and not os.path.isfile(self.baseFilename):
+            return False
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes > 0:
+            msg = "%s%s" % (self.format(record), self.terminator)
+            self._pending = len(msg.encode(self.stream.encoding, 'replace'))
+            return self._size + self._pending >= self.maxBytes
+        return False
+
+    def emit(self, record: logging.LogRecord):
+        self._emitting = True
+        self._urgent = record.levelno >= logging.ERROR
+        try:
+            super().emit(record)
+            self._size += self._pending
+        finally:
+            self._pending = 0
+            self._emitting = False
+
+    def flush(self):
+        # emit icinden gelen flush sadece acil kayitta veya sure dolunca yapilir
+        now = time.monotonic()
+        if self._emitting and not self._urgent and now - self._last_flush < self.FLUSH_INTERVAL:
+            return
+        self._last_flush = now
+        super().flush()
+
+    def close(self):
+        BufferedRotatingFileHandler._live.discard(self)
+        super().close()
+
+    @classmethod
+    def _ensure_flusher(cls):
+        """Tum acik handler'lari periyodik bosaltan tek daemon thread'i baslat."""
+        with cls._flusher_lock:
+            if cls._flusher is None:
+                cls._flusher = threading.Thread(
+                    target=cls._flush_loop, name="log-flusher", daemon=True
+                )
+                cls._flusher.start()
+
+    @classmethod
+    def _flush_loop(cls):
+        while True:
+            time.sleep(cls.FLUSH_INTERVAL)
+            now = time.monotonic()
+            for handler in list(cls._live):
+                if now - handler._last_flush < handler.FLUSH_INTERVAL:
+                    continue
+                try:
+                    handler.flush()
+                except Exception:
+                    pass
+
+
+class TracebackQueueHandler(QueueHandler):
+    """
+    exc_info'yu koruyan QueueHandler.
+
+    Varsayilan prepare() kaydi cagiran thread'de formatlayip exc_info'yu
+    siler; RichHandler'in rich_tracebacks'i istisnayi goremez. Burada
+    sadece mesaj argumanlari birlestirilir, formatlama dinleyicide yapilir.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+
+@dataclass(**DATACLASS_SLOTS)
 class PerformanceMetric:
-    """Performans metrigi."""
+    """
+    Performans metrigi.
+
+    Zaman epoch saniyesi olarak tutulur; ISO metne sadece export
+    sirasinda cevrilir.
+    """
     operation: str
     duration_ms: float
     success: bool
     details: Dict[str, Any] = field(default_factory=dict)
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: float = field(default_factory=time.time)
+
+    @property
+    def timestamp(self) -> str:
+        """ISO formatinda zaman."""
+        return datetime.fromtimestamp(self.created_at).isoformat()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Export icin dict'e cevir."""
+        return {
+            "operation": self.operation,
+            "duration_ms": self.duration_ms,
+            "success": self.success,
+            "details": self.details,
+            "timestamp": self.timestamp,
+        }
 
 
 class RAGLogger:
@@ -66,22 +226,50 @@ class RAGLogger:
 
     _loggers: Dict[str, 'RAGLogger'] = {}
     _config: Optional[LogConfig] = None
-    _performance_metrics: list = []
+    # Uzun calismalarda sinirsiz buyumesin diye halka tampon
+    _performance_metrics: deque = deque(maxlen=LogConfig.metrics_ring_size)
+    # Config basina paylasilan handler'lar (astuple(config) anahtari)
+    _handler_cache: Dict[tuple, List[logging.Handler]] = {}
+    # async_queue icin config basina (QueueHandler, QueueListener)
+    _queue_listeners: Dict[tuple, Tuple[QueueHandler, QueueListener]] = {}
+    # configure() her cagrida arttirir; logger'lar ilk kullanimda yenilenir
+    _generation: int = 0
 
     def __init__(self, name: str, config: Optional[LogConfig] = None):
         self.name = name
         self.config = config or RAGLogger._config or LogConfig()
         self._logger = self._setup_logger()
-        self._metrics: list = []
+        self._metrics: deque = deque(maxlen=self.config.metrics_ring_size)
+        self._generation = RAGLogger._generation
 
     @classmethod
     def configure(cls, config: LogConfig):
         """Global konfigurasyon ayarla."""
         cls._config = config
-        # Mevcut logger'lari guncelle
-        for logger in cls._loggers.values():
-            logger.config = config
-            logger._logger = logger._setup_logger()
+        if cls._performance_metrics.maxlen != config.metrics_ring_size:
+            cls._performance_metrics = deque(
+                cls._performance_metrics, maxlen=config.metrics_ring_size
+            )
+        # Eski kuyruk dinleyicilerini bosaltip durdur, eski handler'lari kapat
+        cls._stop_queue_listeners()
+        cls._close_cached_handlers()
+        # Mevcut logger'lar tek tek kurulmaz; bir sonraki log cagrisinda
+        # _reconfigure ile yenilenirler
+        cls._generation += 1
+
+    def _ensure_current(self):
+        """configure() sonrasi ilk kullanimda logger'i yenile."""
+        if self._generation != RAGLogger._generation:
+            self._reconfigure()
+
+    def _reconfigure(self):
+        """configure() sonrasi logger'i yeni global config'e gecir."""
+        config = RAGLogger._config
+        self.config = config
+        if self._metrics.maxlen != config.metrics_ring_size:
+            self._metrics = deque(self._metrics, maxlen=config.metrics_ring_size)
+        self._logger = self._setup_logger()
+        self._generation = RAGLogger._generation
 
     @classmethod
     def get_logger(cls, name: str) -> 'RAGLogger':
@@ -98,62 +286,128 @@ class RAGLogger:
         # Mevcut handler'lari temizle
         logger.handlers.clear()
 
+        if self.config.async_queue:
+            # Kayitlar kuyruga birakilir; cagiran thread'de sadece mesaj
+            # argumanlari birlestirilir, formatlama ve yazma dinleyici
+            # thread'inde yapilir (exc_info korunur)
+            logger.addHandler(self._get_queue_handler(self.config))
+        else:
+            for handler in self._get_handlers(self.config):
+                logger.addHandler(handler)
+
+        return logger
+
+    @staticmethod
+    def _build_handlers(config: LogConfig) -> List[logging.Handler]:
+        """Config'e gore konsol ve dosya handler'larini olustur."""
+        handlers: List[logging.Handler] = []
+
         # Formatter
-        if self.config.json_format:
+        if config.json_format:
             formatter = JsonFormatter()
         else:
             format_parts = []
-            if self.config.include_timestamp:
+            if config.include_timestamp:
                 format_parts.append("%(asctime)s")
             format_parts.append("[%(levelname)s]")
-            if self.config.include_module:
+            if config.include_module:
                 format_parts.append("[%(name)s]")
             format_parts.append("%(message)s")
             formatter = logging.Formatter(" ".join(format_parts))
 
         # Console handler
-        if self.config.log_to_console:
-            if self.config.use_rich:
+        if config.log_to_console:
+            if config.use_rich:
                 console_handler = RichHandler(
                     console=Console(stderr=True),
-                    show_time=self.config.include_timestamp,
+                    show_time=config.include_timestamp,
                     show_path=False,
                     rich_tracebacks=True
                 )
             else:
                 console_handler = logging.StreamHandler(sys.stdout)
                 console_handler.setFormatter(formatter)
-            logger.addHandler(console_handler)
+            handlers.append(console_handler)
 
         # File handler
-        if self.config.log_to_file:
-            log_dir = Path(self.config.log_dir)
+        if config.log_to_file:
+            log_dir = Path(config.log_dir)
             log_dir.mkdir(parents=True, exist_ok=True)
 
-            log_file = log_dir / f"{self.config.name}_{datetime.now().strftime('%Y%m%d')}.log"
+            log_file = log_dir / f"{config.name}_{datetime.now().strftime('%Y%m%d')}.log"
 
-            file_handler = RotatingFileHandler(
+            file_handler = BufferedRotatingFileHandler(
                 log_file,
-                maxBytes=self.config.max_file_size_mb * 1024 * 1024,
-                backupCount=self.config.backup_count,
+                maxBytes=config.max_file_size_mb * 1024 * 1024,
+                backupCount=config.backup_count,
                 encoding='utf-8'
             )
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+            handlers.append(file_handler)
 
-        return logger
+        return handlers
+
+    @classmethod
+    def _get_handlers(cls, config: LogConfig) -> List[logging.Handler]:
+        """Config icin paylasilan handler'lari al; ayni config tek dosya acar."""
+        key = astuple(config)
+        handlers = cls._handler_cache.get(key)
+        if handlers is None:
+            handlers = cls._handler_cache[key] = cls._build_handlers(config)
+        return handlers
+
+    @classmethod
+    def _close_cached_handlers(cls):
+        """Paylasilan handler'lari kapat (dosya tanitici sizintisini onler)."""
+        for handlers in cls._handler_cache.values():
+            for handler in handlers:
+                handler.close()
+        cls._handler_cache.clear()
+
+    @classmethod
+    def _get_queue_handler(cls, config: LogConfig) -> QueueHandler:
+        """Config icin paylasilan QueueHandler'i al; gerekirse dinleyiciyi baslat."""
+        key = astuple(config)
+        entry = cls._queue_listeners.get(key)
+        if entry is None:
+            log_queue: queue.SimpleQueue = queue.SimpleQueue()
+            listener = QueueListener(log_queue, *cls._build_handlers(config), respect_handler_level=True)
+            listener.start()
+            entry = (TracebackQueueHandler(log_queue), listener)
+            cls._queue_listeners[key] = entry
+        return entry[0]
 
+    @classmethod
+    def _stop_queue_listeners(cls):
+        """Kuyruktaki kayitlari yazip dinleyici thread'lerini durdur."""
+        for _, listener in cls._queue_listeners.values():
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+        cls._queue_listeners.clear()
+
+    # debug/info/warning sik cagrilir: _ensure_current ve seviye kontrolu
+    # burada satir ici yapilir, kapali seviyede ek cerceveye girilmez
     def debug(self, msg: str, **kwargs):
         """Debug seviyesi log."""
-        self._log(logging.DEBUG, msg, **kwargs)
+        if self._generation != RAGLogger._generation:
+            self._reconfigure()
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._emit(logging.DEBUG, msg, False, kwargs)
 
     def info(self, msg: str, **kwargs):
         """Info seviyesi log."""
-        self._log(logging.INFO, msg, **kwargs)
+        if self._generation != RAGLogger._generation:
+            self._reconfigure()
+        if self._logger.isEnabledFor(logging.INFO):
+            self._emit(logging.INFO, msg, False, kwargs)
 
     def warning(self, msg: str, **kwargs):
         """Warning seviyesi log."""
-        self._log(logging.WARNING, msg, **kwargs)
+        if self._generation != RAGLogger._generation:
+            self._reconfigure()
+        if self._logger.isEnabledFor(logging.WARNING):
+            self._emit(logging.WARNING, msg, False, kwargs)
 
     def error(self, msg: str, exc_info: bool = False, **kwargs):
         """Error seviyesi log."""
@@ -165,10 +419,33 @@ class RAGLogger:
 
     def _log(self, level: int, msg: str, exc_info: bool = False, **kwargs):
         """Dahili log metodu."""
-        extra = kwargs.pop('extra', {})
-        extra.update(kwargs)
+        self._ensure_current()
+
+        # Seviye kapaliysa extra birlestirme ve formatlama yapilmaz
+        if self._logger.isEnabledFor(level):
+            self._emit(level, msg, exc_info, kwargs)
+
+    def _emit(self, level: int, msg: str, exc_info: bool, kwargs: Dict[str, Any]):
+        """
+        Extra'lari birlestirip kaydi yaz.
 
-        if extra and not self.config.json_format:
+        Cagiran _ensure_current ve seviye kontrolunu once yapmis olmali;
+        kayit basina tek kontrol icin burada tekrarlanmaz.
+        """
+        # kwargs cagriya ozel yeni bir dict'tir; yalnizca ikisi birden
+        # doluysa birlestirme icin kopya olusur (cagiranin extra'si degismez)
+        extra = kwargs.pop('extra', None)
+        if extra is None:
+            extra = kwargs
+        elif kwargs:
+            extra = {**extra, **kwargs}
+
+        json_format = self.config.json_format
+        if not extra and not json_format:
+            self._logger.log(level, msg, exc_info=exc_info)
+            return
+
+        if extra and not json_format:
             # Extra bilgileri mesaja ekle
             extra_str = " | ".join(f"{k}={v}" for k, v in extra.items())
             msg = f"{msg} ({extra_str})"
@@ -184,6 +461,7 @@ class RAGLogger:
             with logger.timer("embedding"):
                 # islem
         """
+        self._ensure_current()
         start = time.perf_counter()
         success = True
         error_msg = None
@@ -223,24 +501,33 @@ class RAGLogger:
 
     def get_metrics(self) -> list:
         """Bu logger'in metriklerini getir."""
-        return self._metrics
+        return list(self._metrics)
 
     @classmethod
     def get_all_metrics(cls) -> list:
         """Tum metrikleri getir."""
-        return cls._performance_metrics
+        return list(cls._performance_metrics)
 
     @classmethod
     def export_metrics(cls, filepath: str = None) -> str:
         """Metrikleri JSON olarak export et."""
-        metrics_data = [asdict(m) for m in cls._performance_metrics]
-
         if filepath:
+            # Dosyaya kayit kayit yazilir; tum listenin JSON metni bellekte
+            # olusturulmaz. Cikti indent=2 ile tek seferde yazilanla aynidir.
+            metrics = list(cls._performance_metrics)
             with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(metrics_data, f, indent=2, ensure_ascii=False)
+                if not metrics:
+                    f.write('[]')
+                    return filepath
+                sep = '[\n  '
+                for metric in metrics:
+                    f.write(sep)
+                    f.write(_dumps_json(metric.to_dict(), indent=True).replace('\n', '\n  '))
+                    sep = ',\n  '
+                f.write('\n]')
             return filepath
 
-        return json.dumps(metrics_data, indent=2, ensure_ascii=False)
+        return _dumps_json([m.to_dict() for m in cls._performance_metrics], indent=True)
 
     @classmethod
     def reset_metrics(cls):
@@ -250,6 +537,10 @@ class RAGLogger:
             logger._metrics.clear()
 
 
+# Cikista kuyrukta bekleyen log kayitlari kaybolmasin
+atexit.register(RAGLogger._stop_queue_listeners)
+
+
 class JsonFormatter(logging.Formatter):
     """JSON formati log formatter."""
 
@@ -269,7 +560,7 @@ class JsonFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_data, ensure_ascii=False)
+        return _dumps_json(log_data)
 
 
 def log_function_call(logger_name: str = None, log_args: bool = True, log_result: bool = False):
@@ -282,13 +573,22 @@ def log_function_call(logger_name: str = None, log_args: bool = True, log_result
             ...
     """
     def decorator(func: Callable):
+        name = logger_name or func.__module__
+        # Logger ilk cagrida bir kez alinir; configure() ayni nesneyi gunceller
+        logger_ref: List[Optional[RAGLogger]] = [None]
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            name = logger_name or func.__module__
-            logger = RAGLogger.get_logger(name)
+            logger = logger_ref[0]
+            if logger is None:
+                logger = logger_ref[0] = RAGLogger.get_logger(name)
+
+            # Seviye okunmadan once configure() sonrasi yenileme yapilir
+            logger._ensure_current()
+            debug_enabled = logger._logger.isEnabledFor(logging.DEBUG)
 
             # Argumanlari logla
-            if log_args:
+            if log_args and debug_enabled:
                 arg_info = []
                 if args:
                     arg_info.append(f"args={len(args)}")
@@ -301,7 +601,7 @@ def log_function_call(logger_name: str = None, log_args: bool = True, log_result
                 result = func(*args, **kwargs)
 
             # Sonucu logla
-            if log_result and result is not None:
+            if log_result and debug_enabled and result is not None:
                 result_type = type(result).__name__
                 if hasattr(result, '__len__'):
                     logger.debug(f"{func.__name__} sonuc: {result_type}[{len(result)}]")
@@ -354,7 +654,8 @@ def configure_logging(
     log_to_file: bool = True,
     log_dir: str = "logs",
     use_rich: bool = True,
-    json_format: bool = False
+    json_format: bool = False,
+    async_queue: bool = False
 ):
     """
     Logging sistemini konfigure et.
@@ -365,13 +666,15 @@ def configure_logging(
         log_dir: Log dizini
         use_rich: Rich console kullan
         json_format: JSON formati kullan
+        async_queue: Handler'lari QueueListener thread'inde calistir
     """
     config = LogConfig(
         level=level,
         log_to_file=log_to_file,
         log_dir=log_dir,
         use_rich=use_rich,
-        json_format=json_format
+        json_format=json_format,
+        async_queue=async_queue
     )
     RAGLogger.configure(config)
 
@@ -35,6 +35,26 @@ def get_retry_config():
     return DefaultRetry()
 
 
+def _backoff_schedule(
+    min_wait: float,
+    multiplier: float,
+    max_wait: float,
+    retries: int
+) -> Tuple[float, ...]:
+    """
+    Denemeler arasi bekleme surelerini hesapla.
+
+    Returns:
+        i. elemani i+1. basarisiz denemeden sonraki bekleme olan tuple
+    """
+    waits = []
+    wait_time = min_wait
+    for _ in range(retries):
+        waits.append(wait_time)
+        wait_time = min(wait_time * multiplier, max_wait)
+    return tuple(waits)
+
+
 def retry_with_backoff(
     max_attempts: Optional[int] = None,
     min_wait: Optional[float] = None,
@@ -66,11 +86,13 @@ def retry_with_backoff(
     _max_wait = max_wait or config.MAX_WAIT
     _multiplier = multiplier or config.MULTIPLIER
 
+    # Bekleme plani dekorasyon aninda bir kez hesaplanir
+    _waits = _backoff_schedule(_min_wait, _multiplier, _max_wait, _max_attempts - 1)
+
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> T:
             last_exception = None
-            wait_time = _min_wait
 
             for attempt in range(1, _max_attempts + 1):
                 try:
@@ -89,6 +111,7 @@ def retry_with_backoff(
                     if on_retry:
                         on_retry(e, attempt)
 
+                    wait_time = _waits[attempt - 1]
                     logger.warning(
                         f"[{func.__name__}] Deneme {attempt}/{_max_attempts} "
                         f"basarisiz: {e}. {wait_time:.1f}s sonra tekrar deneniyor..."
@@ -96,13 +119,11 @@ def retry_with_backoff(
 
                     time.sleep(wait_time)
 
-                    # Exponential backoff
-                    wait_time = min(wait_time * _multiplier, _max_wait)
-
             # Should not reach here, but just in case
             if last_exception:
                 raise last_exception
 
+        wrapper.wait_schedule = _waits
         return wrapper
     return decorator
 
@@ -145,7 +166,9 @@ def retry_api_call(
             api_exceptions = (ConnectionError, TimeoutError, Exception)
 
     config = get_retry_config()
-    wait_time = config.MIN_WAIT
+    waits = _backoff_schedule(
+        config.MIN_WAIT, config.MULTIPLIER, config.MAX_WAIT, max_attempts - 1
+    )
     last_exception = None
 
     for attempt in range(1, max_attempts + 1):
@@ -158,13 +181,13 @@ def retry_api_call(
                 logger.error(f"API call failed after {max_attempts} attempts: {e}")
                 raise
 
+            wait_time = waits[attempt - 1]
             logger.warning(
                 f"API call attempt {attempt}/{max_attempts} failed: {e}. "
                 f"Retrying in {wait_time:.1f}s..."
             )
 
             time.sleep(wait_time)
-            wait_time = min(wait_time * config.MULTIPLIER, config.MAX_WAIT)
 
     if last_exception:
         raise last_exception
@@ -207,5 +230,14 @@ class RetryableAPIClient:
         )
 
     def __getattr__(self, name: str) -> Any:
-        """Client attribute'larina erisim."""
-        return getattr(self.client, name)
+        """
+        Client attribute'larina erisim.
+
+        Cozulen deger instance sozlugune yazilir; sonraki erisimler
+        __getattr__'a hic dusmez.
+        """
+        if name == 'client':
+            raise AttributeError(name)
+        value = getattr(self.client, name)
+        self.__dict__[name] = value
+        return value
@@ -6,6 +6,7 @@ Turkce sayi formatlarini dogru sekilde parse eden modul.
 """
 
 import re
+from functools import lru_cache
 from typing import Optional, Tuple, Union
 from decimal import Decimal, InvalidOperation
 
@@ -65,13 +66,46 @@ class TurkishNumberParser:
         'integer_us': re.compile(r'^-?\d{1,3}(?:,\d{3})+$'),
     }
 
-    # Carpanli sayi pattern'i
+    # PATTERNS'in _parse_simple_number onceligiyle birlesik hali; eslesen
+    # grubun adi (lastgroup) formati verir
+    _NUMBER_FORMAT = re.compile(
+        r'-?(?:'
+        r'(?P<turkish>\d{1,3}(?:\.\d{3})*,\d+)|'
+        r'(?P<us>\d{1,3}(?:,\d{3})*\.\d+)|'
+        r'(?P<integer_turkish>\d{1,3}(?:\.\d{3})+)|'
+        r'(?P<integer_us>\d{1,3}(?:,\d{3})+)|'
+        r'(?P<decimal_comma>\d+,\d+)|'
+        r'(?P<decimal_dot>\d+\.\d+)|'
+        r'(?P<integer>\d+)'
+        r')'
+    )
+
+    # Carpan alternatifi (uzundan kisaya); pattern'ler IGNORECASE olmadan
+    # derlenir, eslestirme kucuk harfe cevrilmis metin uzerinde yapilir
+    _MULTIPLIER_ALT = '|'.join(sorted(MULTIPLIERS, key=len, reverse=True))
+
+    # extract_numbers icin metin ici arama pattern'leri
+    _EXTRACT_MULTIPLIER = re.compile(
+        r'(-?\d+(?:[.,]\d+)?)\s*(' + _MULTIPLIER_ALT + r')'
+    )
+    _EXTRACT_NUMBER = re.compile(
+        r'-?\d{1,3}(?:[.,]\d{3})*[.,]\d+|'  # Binlik + ondalik
+        r'-?\d{1,3}(?:[.,]\d{3})+|'  # Sadece binlik
+        r'-?\d+[.,]\d+|'  # Sadece ondalik
+        r'-?\d+'  # Sadece tam sayi
+    )
+
+    # _clean_text'te silinen karakterler: para birimleri ve yuzde
+    _STRIP_TABLE = str.maketrans('', '', '₺$€£¥%')
+
+    # Carpan eslestirmesi icin kucuk harfe cevirme; Turkce I harfleri
+    # (MİLYON, mılyon) ASCII i'ye indirgenir
+    _MULTIPLIER_FOLD = str.maketrans({'İ': 'i', 'ı': 'i'})
+
+    # Carpanli sayi pattern'i (kucuk harfli metinle kullanilir)
     MULTIPLIER_PATTERN = re.compile(
         r'^(-?\d+(?:[.,]\d+)?)\s*'  # Sayi kismi
-        r'(bin|milyon|milyar|trilyon|katrilyon|'  # Turkce carpanlar
-        r'thousand|million|billion|trillion|'  # Ingilizce carpanlar
-        r'mn|mln|mr|mlr|k|m|b|t)$',  # Kisaltmalar
-        re.IGNORECASE
+        r'(' + _MULTIPLIER_ALT + r')$'  # Turkce/Ingilizce carpanlar ve kisaltmalar
     )
 
     @classmethod
@@ -100,31 +134,49 @@ class TurkishNumberParser:
                 raise NumberParsingError("", "Bos metin")
             return default
 
+        if not isinstance(text, str):
+            text = str(text)
+
+        # Hizli yol: ayiracsiz tam sayi (1234) veya tek noktali ondalik (1234.56);
+        # her iki durumda da tam parse float(text) ile ayni sonucu verir
+        if text.isascii():
+            whole, dot, frac = text.partition('.')
+            if whole.isdigit() and (not dot or frac.isdigit()):
+                return float(text)
+
+        # Ayni metinler (tablo degerleri, basliklar) tekrar tekrar gelir;
+        # sonuc metin basina onbellekte tutulur
+        value, error = _parse_cached(text)
+        if error is not None:
+            if strict:
+                raise NumberParsingError(*error)
+            return default
+        return value
+
+    @classmethod
+    def _parse_uncached(cls, text: str) -> Tuple[Optional[float], Optional[Tuple[str, str]]]:
+        """
+        Metni parse et; (deger, None) veya (None, (temiz_metin, sebep)) dondur.
+        """
         # Temizle
         text = cls._clean_text(text)
 
         if not text:
-            if strict:
-                raise NumberParsingError(text, "Gecerli sayi bulunamadi")
-            return default
+            return None, (text, "Gecerli sayi bulunamadi")
 
         try:
             # Carpanli sayi kontrolu
-            multiplier_match = cls.MULTIPLIER_PATTERN.match(text)
+            folded = text.translate(cls._MULTIPLIER_FOLD).lower()
+            multiplier_match = cls.MULTIPLIER_PATTERN.match(folded)
             if multiplier_match:
-                number_part = multiplier_match.group(1)
-                multiplier_name = multiplier_match.group(2).lower()
-                base_value = cls._parse_simple_number(number_part)
-                multiplier = cls.MULTIPLIERS.get(multiplier_name, 1)
-                return base_value * multiplier
+                base_value = cls._parse_simple_number(multiplier_match.group(1))
+                return base_value * cls.MULTIPLIERS[multiplier_match.group(2)], None
 
             # Basit sayi
-            return cls._parse_simple_number(text)
+            return cls._parse_simple_number(text), None
 
         except (ValueError, InvalidOperation) as e:
-            if strict:
-                raise NumberParsingError(text, str(e))
-            return default
+            return None, (text, str(e))
 
     @classmethod
     def _clean_text(cls, text: str) -> str:
@@ -132,23 +184,15 @@ class TurkishNumberParser:
         if not isinstance(text, str):
             text = str(text)
 
-        # Bosluklar ve ozel karakterler
-        text = text.strip()
-
-        # Para birimi sembolleri
-        text = re.sub(r'[₺$€£¥]', '', text)
-
-        # Yuzde isareti
-        text = text.replace('%', '')
+        # Bosluklar, para birimi sembolleri ve yuzde isareti (tek geciste)
+        text = text.strip().translate(cls._STRIP_TABLE)
 
         # Parantezli negatif: (123) -> -123
-        if text.startswith('(') and text.endswith(')'):
+        if text[:1] == '(' and text[-1:] == ')':
             text = '-' + text[1:-1]
 
         # Fazla bosluklar
-        text = re.sub(r'\s+', ' ', text)
-
-        return text.strip()
+        return ' '.join(text.split())
 
     @classmethod
     def _parse_simple_number(cls, text: str) -> float:
@@ -160,33 +204,28 @@ class TurkishNumberParser:
         if negative:
             text = text[1:]
 
-        # Format tespiti ve donusum
-        result = None
+        # Format tespiti tek regex ile: alternatif sirasi oncelik sirasidir
+        match = cls._NUMBER_FORMAT.fullmatch(text)
+        kind = match.lastgroup if match else None
 
-        # Turkce format: 1.234.567,89
-        if cls.PATTERNS['turkish'].match(text):
-            # Noktalari kaldir, virgulu noktaya cevir
+        # Turkce format: 1.234.567,89 -> noktalari kaldir, virgulu noktaya cevir
+        if kind == 'turkish':
             result = float(text.replace('.', '').replace(',', '.'))
 
-        # US format: 1,234,567.89
-        elif cls.PATTERNS['us'].match(text):
-            # Virgulleri kaldir
+        # US format (1,234,567.89) veya US binlik tam sayi (1,234,567)
+        elif kind == 'us' or kind == 'integer_us':
             result = float(text.replace(',', ''))
 
         # Binlik ayiracli tam sayi (TR): 1.234.567
-        elif cls.PATTERNS['integer_turkish'].match(text):
+        elif kind == 'integer_turkish':
             result = float(text.replace('.', ''))
 
-        # Binlik ayiracli tam sayi (US): 1,234,567
-        elif cls.PATTERNS['integer_us'].match(text):
-            result = float(text.replace(',', ''))
-
         # Sadece ondalik (virgul): 1234,56
-        elif cls.PATTERNS['decimal_comma'].match(text):
+        elif kind == 'decimal_comma':
             result = float(text.replace(',', '.'))
 
         # Sadece ondalik (nokta) veya tam sayi
-        elif cls.PATTERNS['decimal_dot'].match(text) or cls.PATTERNS['integer'].match(text):
+        elif kind is not None:
             result = float(text)
 
         else:
@@ -210,7 +249,7 @@ class TurkishNumberParser:
         text = cls._clean_text(text)
 
         # Carpanli sayi
-        if cls.MULTIPLIER_PATTERN.match(text):
+        if cls.MULTIPLIER_PATTERN.match(text.translate(cls._MULTIPLIER_FOLD).lower()):
             return 'multiplied'
 
         # Negatif isareti kaldir
@@ -267,42 +306,38 @@ class TurkishNumberParser:
             Bulunan sayilarin listesi
         """
         results = []
+        seen = set()
 
-        # Carpanli sayilari bul
-        multiplier_pattern = re.compile(
-            r'(-?\d+(?:[.,]\d+)?)\s*'
-            r'(bin|milyon|milyar|trilyon|katrilyon|thousand|million|billion|trillion|mn|mln|mr|mlr|k|m|b|t)',
-            re.IGNORECASE
-        )
-
-        for match in multiplier_pattern.finditer(text):
+        # Carpanli sayilar: deger dogrudan gruplardan hesaplanir
+        folded = text.translate(cls._MULTIPLIER_FOLD).lower()
+        for match in cls._EXTRACT_MULTIPLIER.finditer(folded):
             try:
-                value = cls.parse(match.group(0))
-                if value is not None:
-                    results.append(value)
-            except Exception:
-                pass
-
-        # Carpansiz sayilari bul
-        number_pattern = re.compile(
-            r'-?\d{1,3}(?:[.,]\d{3})*[.,]\d+|'  # Binlik + ondalik
-            r'-?\d{1,3}(?:[.,]\d{3})+|'  # Sadece binlik
-            r'-?\d+[.,]\d+|'  # Sadece ondalik
-            r'-?\d+'  # Sadece tam sayi
-        )
-
-        for match in number_pattern.finditer(text):
-            # Carpanli sayilarla cakisma kontrolu
+                value = cls._parse_simple_number(match.group(1))
+            except ValueError:
+                continue
+            value *= cls.MULTIPLIERS[match.group(2)]
+            results.append(value)
+            seen.add(value)
+
+        # Carpansiz sayilar (daha once bulunan degerler atlanir)
+        for match in cls._EXTRACT_NUMBER.finditer(text):
             try:
-                value = cls.parse(match.group(0))
-                if value is not None and value not in results:
-                    results.append(value)
-            except Exception:
-                pass
+                value = cls._parse_simple_number(match.group(0))
+            except ValueError:
+                continue
+            if value not in seen:
+                seen.add(value)
+                results.append(value)
 
         return results
 
 
+@lru_cache(maxsize=4096)
+def _parse_cached(text: str) -> Tuple[Optional[float], Optional[Tuple[str, str]]]:
+    """TurkishNumberParser._parse_uncached'in onbellekli hali."""
+    return TurkishNumberParser._parse_uncached(text)
+
+
 # Convenience functions
 def parse_number(text: str, default: Optional[float] = None) -> Optional[float]:
     """Sayiyi parse et (shortcut)."""
@@ -7,8 +7,9 @@ Guvenlik kontrolleri, format dogrulamalari ve sanitization.
 
 import re
 import os
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, List, Any, Union
+from typing import Optional, List, Any, Union, Tuple
 from urllib.parse import urlparse
 
 from .exceptions import (
@@ -19,6 +20,9 @@ from .exceptions import (
     FileSizeError
 )
 
+# strip_html icin HTML tag pattern'i
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
 # Config import - lazy to avoid circular imports
 _config = None
 
@@ -37,12 +41,8 @@ def _get_config():
                     MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB
                     BLOCKED_DOMAINS = ["localhost", "127.0.0.1", "0.0.0.0"]
                     BLOCKED_EXTENSIONS = [".exe", ".bat", ".sh", ".ps1"]
-                    FORBIDDEN_PATH_PATTERNS = [
-                        r'\.\.',
-                        r'\.\./',
-                        r'/\.\.',
-                        r'\\\.\\.',
-                    ]
+                    # CONFIG ile ayni sekilde duz metin (regex degil)
+                    FORBIDDEN_PATH_PATTERNS = ['..', '\x00']
                     INJECTION_PATTERNS = [
                         r'ignore\s+(previous|all|above)',
                         r'forget\s+(previous|all|your)',
@@ -61,6 +61,52 @@ def _get_config():
     return _config
 
 
+def _compile_any(patterns: Tuple[str, ...], flags: int = 0, literal: bool = False) -> 're.Pattern':
+    """
+    Pattern listesini tek bir alternation regex'ine derle.
+
+    literal=True ise pattern'ler duz metin olarak aranir.
+    """
+    if not patterns:
+        return re.compile(r'(?!)')  # hicbir seyle eslesmez
+    if literal:
+        patterns = tuple(re.escape(p) for p in patterns)
+    return re.compile('|'.join(f'(?:{p})' for p in patterns), flags)
+
+
+@dataclass(frozen=True)
+class _ValidationBundle:
+    """Config ve ondan turetilen derlenmis pattern'ler."""
+    config: Any
+    injection_re: 're.Pattern'
+    forbidden_path_re: 're.Pattern'
+    trusted_domains: Tuple[str, ...]
+
+
+_bundle: Optional[_ValidationBundle] = None
+
+
+def _get_bundle() -> _ValidationBundle:
+    """
+    Config ve derlenmis pattern'leri bir kez olusturup dondur.
+
+    Config listeleri calisma aninda degistirilirse _bundle = None ile yenilenir.
+    """
+    global _bundle
+    bundle = _bundle
+    if bundle is None:
+        config = _get_config()
+        security = config.security
+        bundle = _bundle = _ValidationBundle(
+            config=config,
+            injection_re=_compile_any(tuple(security.INJECTION_PATTERNS), re.IGNORECASE),
+            forbidden_path_re=_compile_any(tuple(security.FORBIDDEN_PATH_PATTERNS), literal=True),
+            # str.endswith tuple ister; fallback config'te liste yok
+            trusted_domains=tuple(getattr(security, 'TRUSTED_DOMAINS', ())),
+        )
+    return bundle
+
+
 class PathValidator:
     """Dosya yolu validation."""
 
@@ -69,7 +115,8 @@ class PathValidator:
         path: str,
         must_exist: bool = True,
         allowed_base: Optional[Path] = None,
-        check_traversal: bool = True
+        check_traversal: bool = True,
+        resolve_symlinks: bool = False
     ) -> Path:
         """
         Dosya yolunu validate et.
@@ -79,6 +126,7 @@ class PathValidator:
             must_exist: Dosyanin var olmasi gerekiyor mu
             allowed_base: Izin verilen temel dizin
             check_traversal: Path traversal kontrolu yap
+            resolve_symlinks: Symlink'leri coz (allowed_base verilirse her zaman)
 
         Returns:
             Dogrulanmis Path nesnesi
@@ -96,13 +144,20 @@ class PathValidator:
 
         # Path traversal kontrolu
         if check_traversal:
-            config = _get_config()
-            for pattern in config.security.FORBIDDEN_PATH_PATTERNS:
-                if pattern in path:
-                    raise PathTraversalError(path)
+            if _get_bundle().forbidden_path_re.search(path):
+                raise PathTraversalError(path)
 
         try:
-            resolved = Path(path).resolve()
+            # resolve() her bilesen icin dosya sistemine gider; symlink cozumu
+            # gerekmiyorsa salt metin islemi olan abspath yeterli. allowed_base
+            # kontrolu symlink ile disari cikmayi yakalamak icin gercek yolu ister.
+            if resolve_symlinks or allowed_base:
+                resolved = Path(path).resolve()
+            else:
+                if '\x00' in path:
+                    # resolve() ile ayni hata (abspath bunu kontrol etmez)
+                    raise ValueError("embedded null byte")
+                resolved = Path(os.path.abspath(path))
         except Exception as e:
             raise InputValidationError("path", path, f"Yol cozumlenemedi: {e}")
 
@@ -120,6 +175,58 @@ class PathValidator:
 
         return resolved
 
+    @staticmethod
+    def validate_many(
+        paths: List[str],
+        must_exist: bool = True,
+        allowed_base: Optional[Path] = None,
+        check_traversal: bool = True,
+        resolve_symlinks: bool = False
+    ) -> List[Path]:
+        """
+        Birden fazla yolu validate et (validate ile ayni kurallar).
+
+        allowed_base bir kez cozulur; yollar metin olarak islenir ve Path
+        nesnesi her yol icin yalnizca sonucta olusturulur.
+
+        Returns:
+            Dogrulanmis Path nesneleri (girdi sirasiyla)
+        """
+        forbidden = _get_bundle().forbidden_path_re if check_traversal else None
+        # allowed_base kontrolu symlink'leri cozulmus gercek yol ister
+        resolver = os.path.realpath if (resolve_symlinks or allowed_base) else os.path.abspath
+
+        base = prefix = None
+        if allowed_base:
+            base = os.path.realpath(allowed_base)
+            prefix = base if base.endswith(os.sep) else base + os.sep
+
+        results = []
+        for path in paths:
+            if not path or not isinstance(path, str):
+                raise InputValidationError("path", path, "Bos veya gecersiz yol")
+            path = path.strip()
+
+            if forbidden is not None and forbidden.search(path):
+                raise PathTraversalError(path)
+
+            try:
+                if '\x00' in path:
+                    raise ValueError("embedded null byte")
+                resolved = resolver(path)
+            except Exception as e:
+                raise InputValidationError("path", path, f"Yol cozumlenemedi: {e}")
+
+            if base is not None and resolved != base and not resolved.startswith(prefix):
+                raise PathTraversalError(path)
+
+            if must_exist and not os.path.exists(resolved):
+                raise InputValidationError("path", path, "Dosya veya dizin bulunamadi")
+
+            results.append(Path(resolved))
+
+        return results
+
     @staticmethod
     def validate_file(
         path: str,
@@ -243,7 +350,7 @@ class URLValidator:
         # Domain kontrolu
         if allowed_domains:
             domain = parsed.netloc.lower()
-            if not any(domain.endswith(d) for d in allowed_domains):
+            if not domain.endswith(tuple(allowed_domains)):
                 raise URLValidationError(url, f"Domain izin verilmiyor")
 
         return url
@@ -252,10 +359,7 @@ class URLValidator:
     def is_trusted_domain(url: str) -> bool:
         """URL'in guvenilir domain'den olup olmadigini kontrol et."""
         try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-            config = _get_config()
-            return any(domain.endswith(d) for d in config.security.TRUSTED_DOMAINS)
+            return urlparse(url).netloc.lower().endswith(_get_bundle().trusted_domains)
         except Exception:
             return False
 
@@ -288,13 +392,14 @@ class TextValidator:
         if not isinstance(text, str):
             text = str(text)
 
-        # Null byte'lari kaldir
-        if remove_null_bytes:
+        # Null byte'lari kaldir ('in' memchr ile tarar; null yoksa replace'in
+        # daha yavas aramasina hic girilmez)
+        if remove_null_bytes and '\x00' in text:
             text = text.replace('\x00', '')
 
         # HTML tag'lerini kaldir
-        if strip_html:
-            text = re.sub(r'<[^>]+>', '', text)
+        if strip_html and '<' in text:
+            text = _HTML_TAG_RE.sub('', text)
 
         # Truncate
         if max_length and len(text) > max_length:
@@ -316,14 +421,7 @@ class TextValidator:
         if not text:
             return False
 
-        config = _get_config()
-        text_lower = text.lower()
-
-        for pattern in config.security.INJECTION_PATTERNS:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                return True
-
-        return False
+        return _get_bundle().injection_re.search(text) is not None
 
     @staticmethod
     def sanitize_for_prompt(text: str, max_length: int = 10000) -> str:
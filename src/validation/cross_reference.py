@@ -2,7 +2,7 @@
 
 import re
 import sys
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, List, Set, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -73,11 +73,57 @@ class CrossReferenceChecker:
         ],
     }
 
-    def __init__(self):
-        pass
+    # METRIC_PATTERNS'in derlenmis hali (sinif tanimlanirken bir kez)
+    _COMPILED_PATTERNS = {
+        metric: [re.compile(p, re.IGNORECASE) for p in patterns]
+        for metric, patterns in METRIC_PATTERNS.items()
+    }
+
+    # On filtre: metrigin tum pattern'lerinde gecen anahtar kelime. Metin
+    # _KEYWORD_FOLD ile kucuk harfe indirgenip aranir; IGNORECASE ile
+    # eslesebilecek her metin bu kelimeyi icerir
+    _METRIC_KEYWORDS = {
+        "pazar_buyuklugu": "pazar",
+        "hedef_gelir": "hedef",
+        "hedef_musteri": "hedef",
+        "yatirim_ihtiyaci": "yatirim",
+        "buyume_orani": "büyüme",
+        "basa_bas_suresi": "başa",
+    }
+    # IGNORECASE'te I/i/İ/ı birbirine eslesir; hepsi 'i'ye indirgenir
+    _KEYWORD_FOLD = str.maketrans({'İ': 'i', 'ı': 'i'})
+    # METRIC_PATTERNS'in en kisa olasi eslesmesi ("büyüme5"); daha kisa
+    # bolumlerde hicbir pattern eslesemez
+    _MIN_MATCH_LEN = 7
+
+    def __init__(self, only_metric_sections: bool = False):
+        """
+        Args:
+            only_metric_sections: Metrikleri yalnizca METRIC_SECTIONS'ta
+                listelenen bolumlerden cikar
+        """
+        # Bolum -> [(metrik, pattern'ler)]; None ise tum bolumlerde tum metrikler
+        self._section_patterns = None
+        if only_metric_sections:
+            self._section_patterns = {}
+            for metric_name, sections in self.METRIC_SECTIONS.items():
+                patterns = self._COMPILED_PATTERNS.get(metric_name)
+                if patterns is None:
+                    continue
+                for section_id in sections:
+                    self._section_patterns.setdefault(section_id, []).append(
+                        (metric_name, patterns)
+                    )
 
     def check(self, report_content: Dict[str, str]) -> List[CrossRefIssue]:
         """Çapraz referans kontrolü yap."""
+        return self._check_with_metrics(report_content)[0]
+
+    def _check_with_metrics(
+        self,
+        report_content: Dict[str, str]
+    ) -> Tuple[List[CrossRefIssue], Dict[str, Dict[str, Any]]]:
+        """Kontrol yap; sorunlarla birlikte çıkarılan metrikleri de döndür."""
         issues = []
 
         # Her metrik için değerleri topla
@@ -88,12 +134,16 @@ class CrossReferenceChecker:
             if len(section_values) < 2:
                 continue
 
-            # Değerleri karşılaştır
+            # Değerleri ortanca değere göre karşılaştır
             values_list = list(section_values.items())
-            base_section, base_value = values_list[0]
+            base_index = self._baseline_index(values_list)
+            base_section, base_value = values_list[base_index]
 
-            for other_section, other_value in values_list[1:]:
-                if not self._values_match(base_value, other_value, metric_name):
+            for index, (other_section, other_value) in enumerate(values_list):
+                if index == base_index:
+                    continue
+                matches, close = self._compare(base_value, other_value)
+                if not matches:
                     issues.append(CrossRefIssue(
                         source_section=base_section,
                         target_section=other_section,
@@ -101,24 +151,36 @@ class CrossReferenceChecker:
                         source_value=base_value,
                         target_value=other_value,
                         message=f"'{metric_name}' değeri tutarsız: {base_section}={base_value} vs {other_section}={other_value}",
-                        severity="warning" if self._is_close(base_value, other_value) else "error"
+                        severity="warning" if close else "error"
                     ))
 
-        return issues
+        return issues, metric_values
 
     def _extract_all_metrics(self, content: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
         """Tüm bölümlerden metrikleri çıkar."""
-        metric_values = {}
+        metric_values = {metric_name: {} for metric_name in self._COMPILED_PATTERNS}
 
-        for metric_name, patterns in self.METRIC_PATTERNS.items():
-            metric_values[metric_name] = {}
+        # Bolumler dista: bos/kisa bolum tum metrikler icin bir kez elenir,
+        # anahtar kelime aramasi icin metin bir kez kucuk harfe cevrilir
+        for section_id, text in content.items():
+            if not text or len(text) < self._MIN_MATCH_LEN:
+                continue
+            if self._section_patterns is None:
+                section_patterns = self._COMPILED_PATTERNS.items()
+            else:
+                section_patterns = self._section_patterns.get(section_id)
+                if not section_patterns:
+                    continue
+            folded = text.translate(self._KEYWORD_FOLD).lower()
 
-            for section_id, text in content.items():
-                if not text:
+            for metric_name, patterns in section_patterns:
+                # Anahtar kelime yoksa pattern'ler eslesemez
+                keyword = self._METRIC_KEYWORDS.get(metric_name)
+                if keyword and keyword not in folded:
                     continue
 
                 for pattern in patterns:
-                    match = re.search(pattern, text, re.IGNORECASE)
+                    match = pattern.search(text)
                     if match:
                         try:
                             value = self._parse_value(match)
@@ -136,89 +198,85 @@ class CrossReferenceChecker:
 
     def _parse_value(self, match) -> float:
         """Regex eşleşmesinden sayısal değer çıkar - Turkce format destekli."""
-        groups = match.groups()
+        # Tum METRIC_PATTERNS'te sayi 1. gruptadir; diger gruplar (carpan,
+        # para birimi) tek basina sayiya cevrilemez
+        group = match.group(1)
+        if not group:
+            return None
+
         full_match = match.group(0).lower()
+        if 'milyar' in full_match:
+            multiplier_name, multiplier = 'milyar', 1_000_000_000
+        elif 'milyon' in full_match:
+            multiplier_name, multiplier = 'milyon', 1_000_000
+        else:
+            multiplier_name, multiplier = None, 1
 
-        # İlk sayısal grubu bul
-        for group in groups:
-            if group:
-                # TurkishNumberParser varsa kullan (carpanli destek dahil)
-                if TurkishNumberParser:
-                    # Carpanli text olustur
-                    text_to_parse = group
-                    if 'milyar' in full_match:
-                        text_to_parse = f"{group} milyar"
-                    elif 'milyon' in full_match:
-                        text_to_parse = f"{group} milyon"
-
-                    result = TurkishNumberParser.parse(text_to_parse)
-                    if result is not None:
-                        return result
-
-                # Fallback
-                if group.replace(',', '.').replace('.', '').isdigit():
-                    value = float(group.replace(',', '.'))
-
-                    # Çarpan kontrolü
-                    if 'milyar' in full_match:
-                        value *= 1_000_000_000
-                    elif 'milyon' in full_match:
-                        value *= 1_000_000
-
-                    return value
+        # TurkishNumberParser varsa kullan (carpanli destek dahil)
+        if TurkishNumberParser:
+            text_to_parse = f"{group} {multiplier_name}" if multiplier_name else group
+            result = TurkishNumberParser.parse(text_to_parse)
+            if result is not None:
+                return result
 
-        return None
+        # Fallback: grup yalnizca rakam ve ayiraclardan olusur; ayiraclar
+        # disinda bir sey kaldiysa en az bir rakam vardir
+        if group.strip('.,'):
+            return float(group.replace(',', '.')) * multiplier
 
-    def _values_match(self, val1: Any, val2: Any, metric_name: str) -> bool:
-        """İki değerin eşleşip eşleşmediğini kontrol et."""
-        if val1 is None or val2 is None:
-            return True
+        return None
 
+    @staticmethod
+    def _baseline_index(values_list: List[Tuple[str, Any]]) -> int:
+        """
+        Karşılaştırma tabanı olacak bölümün indeksini seç.
+
+        Üç ve daha fazla değerde ortanca değer seçilir; ilk bölüm aykırıysa
+        diğer tüm bölümler hatalı raporlanmaz. İki değerde (veya sayısal
+        olmayan değerlerde) ilk bölüm kullanılır.
+        """
+        if len(values_list) < 3:
+            return 0
         try:
-            v1 = float(val1)
-            v2 = float(val2)
-
-            # Tolerans: %10
-            tolerance = 0.1
-
-            if v1 == 0 and v2 == 0:
-                return True
-
-            if v1 == 0 or v2 == 0:
-                return False
+            order = sorted(range(len(values_list)), key=lambda i: float(values_list[i][1]))
+        except (TypeError, ValueError):
+            return 0
+        return order[len(order) // 2]
 
-            ratio = abs(v1 - v2) / max(abs(v1), abs(v2))
-            return ratio <= tolerance
+    def _compare(self, val1: Any, val2: Any) -> Tuple[bool, bool]:
+        """
+        İki değeri tek dönüşümle karşılaştır.
 
-        except (TypeError, ValueError):
-            return str(val1).lower() == str(val2).lower()
+        Returns:
+            (eşleşiyor mu (%10), yakın mı (%20))
+        """
+        if val1 is None or val2 is None:
+            return True, True
 
-    def _is_close(self, val1: Any, val2: Any, tolerance: float = 0.2) -> bool:
-        """İki değerin yakın olup olmadığını kontrol et."""
         try:
             v1 = float(val1)
             v2 = float(val2)
+        except (TypeError, ValueError):
+            # Sayisal degil: metin olarak karsilastir, yakinlik yok
+            return str(val1).lower() == str(val2).lower(), False
 
-            if v1 == 0 and v2 == 0:
-                return True
-
-            if v1 == 0 or v2 == 0:
-                return False
+        if v1 == 0 and v2 == 0:
+            return True, True
 
-            ratio = abs(v1 - v2) / max(abs(v1), abs(v2))
-            return ratio <= tolerance
+        if v1 == 0 or v2 == 0:
+            return False, False
 
-        except (ValueError, TypeError, ZeroDivisionError):
-            # Sayisal karsilastirma yapilamadi
-            return False
+        a1 = abs(v1)
+        a2 = abs(v2)
+        ratio = abs(v1 - v2) / (a1 if a1 > a2 else a2)
+        return ratio <= 0.1, ratio <= 0.2
 
     def generate_consistency_report(
         self,
         content: Dict[str, str]
     ) -> str:
         """Tutarlılık raporu oluştur."""
-        issues = self.check(content)
-        metric_values = self._extract_all_metrics(content)
+        issues, metric_values = self._check_with_metrics(content)
 
         report = []
         report.append("=" * 60)
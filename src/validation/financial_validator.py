@@ -26,6 +26,16 @@ except ImportError:
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Derlenmis pattern'ler - her cagrida yeniden derlenmez
+_MONEY_RES = [
+    re.compile(r'([\d.,]+)\s*(milyon|milyar)?\s*(TL|USD|EUR|\$|€|₺)', re.IGNORECASE),
+    re.compile(r'(TL|USD|EUR|\$|€|₺)\s*([\d.,]+)\s*(milyon|milyar)?', re.IGNORECASE),
+]
+_PCT_RE = re.compile(r'%\s*([\d.,]+)|([yüzde|percent]+)\s*([\d.,]+)|([\d.,]+)\s*%', re.IGNORECASE)
+_YEAR_RE = re.compile(r'\b(20[1-3][0-9])\b')
+_TABLE_PCT_RE = re.compile(r'\|[^|]*\|\s*([\d.,]+)\s*%?\s*\|')
+_GROWTH_KW_RE = re.compile(r'büyüme|artış|growth', re.IGNORECASE)
+
 
 class IssueSeverity(str, Enum):
     """Sorun ciddiyet seviyeleri."""
@@ -167,16 +177,13 @@ class FinancialValidator:
         # 2. Yüzde toplamlarını kontrol et
         issues.extend(self._check_percentage_sums(report_content))
 
-        # 3. Finansal oranları kontrol et
-        issues.extend(self._check_financial_ratios(all_numbers, sector))
-
-        # 4. Büyüme oranlarını kontrol et
+        # 3. Büyüme oranlarını kontrol et
         issues.extend(self._check_growth_rates(all_numbers))
 
-        # 5. Mantıksal tutarlılığı kontrol et
+        # 4. Mantıksal tutarlılığı kontrol et
         issues.extend(self._check_logical_consistency(all_numbers))
 
-        # 6. Zaman serisi tutarlılığını kontrol et
+        # 5. Zaman serisi tutarlılığını kontrol et
         issues.extend(self._check_time_series(all_numbers))
 
         # Skor hesapla
@@ -200,18 +207,6 @@ class FinancialValidator:
         """İçerikten sayısal değerleri çıkar."""
         numbers = {}
 
-        # Para birimi pattern'leri
-        money_patterns = [
-            r'([\d.,]+)\s*(milyon|milyar)?\s*(TL|USD|EUR|\$|€|₺)',
-            r'(TL|USD|EUR|\$|€|₺)\s*([\d.,]+)\s*(milyon|milyar)?',
-        ]
-
-        # Yüzde pattern'i
-        percentage_pattern = r'%\s*([\d.,]+)|([yüzde|percent]+)\s*([\d.,]+)|([\d.,]+)\s*%'
-
-        # Büyüme/oran pattern'i
-        growth_pattern = r'(büyüme|artış|düşüş|growth|increase|decrease)[:\s]*([\d.,]+)\s*%?'
-
         for section_id, text in content.items():
             if not text:
                 continue
@@ -225,8 +220,8 @@ class FinancialValidator:
             }
 
             # Para değerlerini bul
-            for pattern in money_patterns:
-                for match in re.finditer(pattern, text, re.IGNORECASE):
+            for pattern in _MONEY_RES:
+                for match in pattern.finditer(text):
                     try:
                         value = self._parse_number(match.group(1) if match.group(1) else match.group(2))
                         multiplier = match.group(2) if len(match.groups()) > 1 else None
@@ -245,7 +240,7 @@ class FinancialValidator:
                         pass
 
             # Yüzdeleri bul
-            for match in re.finditer(percentage_pattern, text, re.IGNORECASE):
+            for match in _PCT_RE.finditer(text):
                 try:
                     groups = [g for g in match.groups() if g and g.replace(',', '.').replace('.', '').isdigit()]
                     if groups:
@@ -260,8 +255,7 @@ class FinancialValidator:
                     pass
 
             # Yılları bul
-            year_pattern = r'\b(20[1-3][0-9])\b'
-            for match in re.finditer(year_pattern, text):
+            for match in _YEAR_RE.finditer(text):
                 section_numbers['years'].append({
                     'value': int(match.group(1)),
                     'position': match.start()
@@ -296,18 +290,14 @@ class FinancialValidator:
         """Yüzde toplamlarını kontrol et."""
         issues = []
 
-        # Pazar payı kontrolü
-        market_share_pattern = r'pazar\s*payı[:\s]*([\d.,]+)\s*%'
-
         for section_id, text in content.items():
             if not text:
                 continue
 
             # Tablo içindeki yüzdeleri bul
-            table_pattern = r'\|[^|]*\|\s*([\d.,]+)\s*%?\s*\|'
             percentages_in_tables = []
 
-            for match in re.finditer(table_pattern, text):
+            for match in _TABLE_PCT_RE.finditer(text):
                 try:
                     val = self._parse_number(match.group(1))
                     if 0 < val <= 100:
@@ -332,32 +322,6 @@ class FinancialValidator:
 
         return issues
 
-    def _check_financial_ratios(
-        self,
-        numbers: Dict[str, List[Dict]],
-        sector: str
-    ) -> List[ValidationIssue]:
-        """Finansal oranları sektör benchmark'larıyla karşılaştır."""
-        issues = []
-        benchmarks = self.SECTOR_BENCHMARKS.get(sector, self.SECTOR_BENCHMARKS['default'])
-
-        # Tüm yüzdeleri topla
-        all_percentages = []
-        for section_data in numbers.values():
-            all_percentages.extend([p['value'] for p in section_data.get('percentages', [])])
-
-        # Marjin kontrolü
-        for pct in all_percentages:
-            # Net kar marjı gibi görünen değerler
-            if 'net_margin' in benchmarks:
-                min_val, max_val = benchmarks['net_margin']
-                # Çok yüksek marjin uyarısı
-                if pct > 50 and pct < 100:
-                    # Bu muhtemelen bir marjin değil, başka bir yüzde
-                    pass
-
-        return issues
-
     def _check_growth_rates(self, numbers: Dict[str, List[Dict]]) -> List[ValidationIssue]:
         """Büyüme oranlarının mantıklı olup olmadığını kontrol et."""
         issues = []
@@ -368,7 +332,7 @@ class FinancialValidator:
                 text = pct.get('text', '')
 
                 # Büyüme oranı olarak görünen yüksek değerler
-                if 'büyüme' in text.lower() or 'artış' in text.lower() or 'growth' in text.lower():
+                if _GROWTH_KW_RE.search(text):
                     if value > 500:
                         issues.append(ValidationIssue(
                             severity=IssueSeverity.ERROR,
@@ -257,6 +257,199 @@ class TestLogging:
         metrics = logger.get_metrics()
         assert isinstance(metrics, list)
 
+    def test_metrics_ring_buffer_is_bounded(self):
+        """Metrik listesi metrics_ring_size ile sinirli."""
+        from src.utils.logger import RAGLogger, LogConfig
+
+        RAGLogger.configure(LogConfig(log_to_file=False, log_to_console=False, metrics_ring_size=3))
+        logger = RAGLogger.get_logger("ring_test")
+        for i in range(5):
+            logger.log_performance(f"op{i}", 1.0)
+
+        assert [m.operation for m in logger.get_metrics()] == ["op2", "op3", "op4"]
+        RAGLogger.configure(LogConfig(log_to_file=False, log_to_console=False))
+
+    def test_loggers_share_file_handler(self, temp_dir):
+        """Ayni config'teki logger'lar tek dosya handler'ini paylasir."""
+        from src.utils.logger import RAGLogger, LogConfig
+
+        RAGLogger.configure(LogConfig(log_to_console=False, log_dir=str(temp_dir)))
+        first = RAGLogger.get_logger("paylasim_a")
+        second = RAGLogger.get_logger("paylasim_b")
+        assert first._logger.handlers == second._logger.handlers
+        assert len(first._logger.handlers) == 1
+
+    def test_extra_dict_is_not_mutated(self, temp_dir):
+        """Cagiranin extra sozlugu kwargs ile birlestirilirken degismez."""
+        from src.utils.logger import RAGLogger, LogConfig
+
+        RAGLogger.configure(LogConfig(log_to_console=False, log_dir=str(temp_dir)))
+        logger = RAGLogger.get_logger("extra_test")
+        extra = {"batch_size": 32}
+        logger.info("Extra mesaji", extra=extra, model="bge")
+
+        assert extra == {"batch_size": 32}
+        RAGLogger.configure(LogConfig(log_to_file=False, log_to_console=False))
+        content = "".join(p.read_text(encoding="utf-8") for p in temp_dir.glob("*.log"))
+        assert "batch_size=32 | model=bge" in content
+
+    def test_export_metrics_file_matches_string(self, temp_dir):
+        """Akis halinde yazilan metrik dosyasi string export ile ayni."""
+        from src.utils.logger import RAGLogger, LogConfig
+
+        RAGLogger.configure(LogConfig(log_to_file=False, log_to_console=False))
+        RAGLogger.reset_metrics()
+        logger = RAGLogger.get_logger("export_test")
+        for name in ("parse", "embed"):
+            with logger.timer(name):
+                pass
+
+        out_file = temp_dir / "metrics.json"
+        RAGLogger.export_metrics(str(out_file))
+        assert out_file.read_text(encoding="utf-8") == RAGLogger.export_metrics()
+
+    def test_configure_refreshes_loggers_lazily(self):
+        """configure() sonrasi logger ilk kullanimda yeni config'e gecer."""
+        import logging
+        from src.utils.logger import RAGLogger, LogConfig
+
+        RAGLogger.configure(LogConfig(log_to_file=False, log_to_console=False))
+        logger = RAGLogger.get_logger("lazy_test")
+
+        new_config = LogConfig(level="WARNING", log_to_file=False, log_to_console=False)
+        RAGLogger.configure(new_config)
+        assert logger.config is not new_config
+
+        logger.info("Bu mesaj yeni seviyede yazilmaz")
+        assert logger.config is new_config
+        assert not logger._logger.isEnabledFor(logging.INFO)
+        RAGLogger.configure(LogConfig(log_to_file=False, log_to_console=False))
+
+    def test_decorator_sees_new_level_after_configure(self):
+        """configure() sonrasi ilk decorated cagri yeni seviyeyi kullanir."""
+        from src.utils.logger import RAGLogger, LogConfig, log_function_call
+
+        RAGLogger.configure(LogConfig(log_to_file=False, log_to_console=False))
+
+        @log_function_call("decorator_level_test")
+        def topla(a, b):
+            return a + b
+
+        topla(1, 2)
+        logger = RAGLogger.get_logger("decorator_level_test")
+        calls = []
+        logger.debug = lambda msg, **kwargs: calls.append(msg)
+
+        RAGLogger.configure(LogConfig(level="DEBUG", log_to_file=False, log_to_console=False))
+        topla(1, 2)
+        assert calls == ["topla cagriliyor: args=2"]
+        RAGLogger.configure(LogConfig(log_to_file=False, log_to_console=False))
+
+    def test_async_queue_logging(self, temp_dir):
+        """Kuyruk uzerinden yazilan kayitlar dosyaya ulasir."""
+        from src.utils.logger import RAGLogger, LogConfig
+
+        config = LogConfig(
+            log_to_file=True,
+            log_to_console=False,
+            log_dir=str(temp_dir),
+            async_queue=True
+        )
+        RAGLogger.configure(config)
+
+        logger = RAGLogger.get_logger("async_test")
+        logger.info("Kuyruk mesaji", batch=3)
+
+        # Yeniden konfigurasyon dinleyiciyi bosaltip durdurur
+        RAGLogger.configure(LogConfig(log_to_file=False, log_to_console=False))
+
+        content = "".join(p.read_text(encoding="utf-8") for p in temp_dir.glob("*.log"))
+        assert "Kuyruk mesaji (batch=3)" in content
+
+    def test_async_queue_keeps_exception(self, temp_dir):
+        """Kuyruk modunda istisna bilgisi dinleyici handler'larina ulasir."""
+        import logging
+        from src.utils.logger import RAGLogger, LogConfig
+
+        config = LogConfig(
+            log_to_file=True,
+            log_to_console=False,
+            log_dir=str(temp_dir),
+            async_queue=True
+        )
+        RAGLogger.configure(config)
+
+        logger = RAGLogger.get_logger("async_exc_test")
+        logger.info("Baslangic")
+
+        # RichHandler gibi exc_info bekleyen handler'i taklit et
+        records = []
+        capture = logging.Handler()
+        capture.emit = records.append
+        _, listener = next(iter(RAGLogger._queue_listeners.values()))
+        listener.handlers = listener.handlers + (capture,)
+
+        try:
+            1 / 0
+        except ZeroDivisionError:
+            logger.error("Bolme hatasi", exc_info=True)
+
+        RAGLogger.configure(LogConfig(log_to_file=False, log_to_console=False))
+
+        content = "".join(p.read_text(encoding="utf-8") for p in temp_dir.glob("*.log"))
+        assert "Bolme hatasi" in content
+        assert content.count("ZeroDivisionError") == 1
+        assert records[-1].exc_info[0] is ZeroDivisionError
+
+    def test_buffered_file_handler_flushes_errors(self, temp_dir):
+        """Tamponlu handler ERROR kaydinda ve close'da diske yazar."""
+        import logging
+        from src.utils.logger import BufferedRotatingFileHandler
+
+        log_file = temp_dir / "buffered.log"
+        handler = BufferedRotatingFileHandler(log_file, encoding="utf-8")
+        handler.FLUSH_INTERVAL = 60.0
+
+        def record(level, msg):
+            return logging.LogRecord("t", level, __file__, 1, msg, None, None)
+
+        handler.handle(record(logging.INFO, "bilgi"))
+        assert log_file.read_text(encoding="utf-8") == ""
+
+        handler.handle(record(logging.ERROR, "hata"))
+        assert log_file.read_text(encoding="utf-8") == "bilgi\nhata\n"
+
+        handler.handle(record(logging.INFO, "son"))
+        handler.close()
+        assert log_file.read_text(encoding="utf-8").endswith("son\n")
+
+    def test_buffered_file_handler_with_max_bytes(self, temp_dir):
+        """maxBytes > 0 iken de tampon korunur ve rollover calisir."""
+        import logging
+        from src.utils.logger import BufferedRotatingFileHandler
+
+        log_file = temp_dir / "rotating.log"
+        handler = BufferedRotatingFileHandler(
+            log_file, maxBytes=40, backupCount=1, encoding="utf-8"
+        )
+        handler.FLUSH_INTERVAL = 60.0
+
+        def record(level, msg):
+            return logging.LogRecord("t", level, __file__, 1, msg, None, None)
+
+        handler.handle(record(logging.INFO, "bilgi"))
+        handler.handle(record(logging.INFO, "not"))
+        assert log_file.read_text(encoding="utf-8") == ""
+
+        handler.handle(record(logging.ERROR, "hata"))
+        assert log_file.read_text(encoding="utf-8") == "bilgi\nnot\nhata\n"
+
+        # 40 bayt sinirini asan kayit yeni dosyaya gecer
+        handler.handle(record(logging.INFO, "x" * 30))
+        handler.close()
+        assert (temp_dir / "rotating.log.1").read_text(encoding="utf-8") == "bilgi\nnot\nhata\n"
+        assert log_file.read_text(encoding="utf-8") == "x" * 30 + "\n"
+
     def test_timer_context_manager(self, temp_dir):
         """Timer context manager testi."""
         from src.utils.logger import RAGLogger, LogConfig
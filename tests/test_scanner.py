@@ -0,0 +1,124 @@
+"""
+Unit Tests for File Scanner
+===========================
+Tests for directory traversal, statistics and warm-scan cache.
+"""
+
+import json
+import pytest
+from pathlib import Path
+
+# Import modules to test
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scanner import FileScanner
+from src.types import FileCategory
+
+
+@pytest.fixture
+def sample_tree(tmp_path):
+    """Karisik dosyalardan olusan ornek klasor agaci."""
+    (tmp_path / "rapor.pdf").write_bytes(b"x" * 10)
+    (tmp_path / "notlar.txt").write_text("desteklenmiyor")
+    (tmp_path / ".gizli.pdf").write_bytes(b"x")
+
+    alt = tmp_path / "alt"
+    alt.mkdir()
+    (alt / "Tablo.XLSX").write_bytes(b"x" * 20)
+    (alt / "grafik.png").write_bytes(b"x" * 5)
+
+    ignored = tmp_path / "node_modules"
+    ignored.mkdir()
+    (ignored / "paket.pdf").write_bytes(b"x")
+
+    return tmp_path
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SCAN TESTS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestFileScanner:
+    """FileScanner testleri."""
+
+    def test_scan_finds_supported_files(self, sample_tree):
+        """Desteklenen dosyalar bulunur, gizli ve yok sayilanlar atlanir."""
+        result = FileScanner().scan(sample_tree, show_progress=False)
+        names = [f.name for f in result.files]
+        assert names == ["Tablo.XLSX", "grafik.png", "rapor.pdf"]
+
+    def test_scan_statistics(self, sample_tree):
+        """Sayac ve boyut istatistikleri."""
+        result = FileScanner().scan(sample_tree, show_progress=False)
+        assert result.stats["total"] == 3
+        assert result.stats["excel"] == 1
+        assert result.stats_size["pdf"] == 10
+        assert result.total_size == 35
+
+    def test_extension_is_lowercased(self, sample_tree):
+        """Uzanti kucuk harfe cevrilir."""
+        result = FileScanner().scan(sample_tree, show_progress=False)
+        excel = result.get_files_by_category(FileCategory.EXCEL)
+        assert excel[0].extension == ".xlsx"
+
+    def test_parallel_scan_matches_serial(self, sample_tree):
+        """Paralel tarama seri tarama ile ayni sonucu verir."""
+        scanner = FileScanner()
+        serial = scanner.scan(sample_tree, show_progress=False)
+        parallel = scanner.scan(sample_tree, show_progress=False, max_workers=4)
+        assert [f.path for f in parallel.files] == [f.path for f in serial.files]
+
+    def test_custom_ignored_dirs(self, sample_tree):
+        """Bos ignored_dirs ile tum klasorler taranir."""
+        result = FileScanner(ignored_dirs=()).scan(sample_tree, show_progress=False)
+        assert "paket.pdf" in [f.name for f in result.files]
+
+    def test_to_json_matches_to_dict(self, sample_tree, tmp_path_factory):
+        """Akis halinde JSON cikti to_dict ile ayni."""
+        result = FileScanner().scan(sample_tree, show_progress=False)
+        out_file = tmp_path_factory.mktemp("out") / "scan.json"
+        with open(out_file, "wb") as f:
+            result.to_json(f)
+
+        assert json.loads(out_file.read_text(encoding="utf-8")) == result.to_dict()
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# WARM SCAN CACHE TESTS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestScanCache:
+    """Sicak tarama onbellegi testleri."""
+
+    def test_unchanged_dirs_are_not_rescanned(self, sample_tree, tmp_path_factory):
+        """Degismeyen klasorler onbellekten okunur."""
+        cache_file = tmp_path_factory.mktemp("cache") / "scan.json"
+        scanner = FileScanner(cache_path=cache_file)
+        first = scanner.scan(sample_tree, show_progress=False)
+
+        calls = []
+        original = scanner._scan_dir
+        scanner._scan_dir = lambda d: (calls.append(d), original(d))[1]
+
+        second = scanner.scan(sample_tree, show_progress=False)
+        assert calls == []
+        assert [f.to_dict() for f in second.files] == [f.to_dict() for f in first.files]
+
+    def test_changed_dir_is_rescanned(self, sample_tree, tmp_path_factory):
+        """Dosya eklenen klasor yeniden okunur."""
+        cache_file = tmp_path_factory.mktemp("cache") / "scan.json"
+        scanner = FileScanner(cache_path=cache_file)
+        scanner.scan(sample_tree, show_progress=False)
+
+        (sample_tree / "alt" / "yeni.docx").write_bytes(b"x")
+        result = scanner.scan(sample_tree, show_progress=False)
+        assert "yeni.docx" in [f.name for f in result.files]
+
+    def test_corrupt_cache_is_ignored(self, sample_tree, tmp_path_factory):
+        """Bozuk onbellek dosyasi taramayi engellemez."""
+        cache_file = tmp_path_factory.mktemp("cache") / "scan.json"
+        cache_file.write_text("{bozuk")
+        result = FileScanner(cache_path=cache_file).scan(sample_tree, show_progress=False)
+        assert result.stats["total"] == 3
+
@@ -21,11 +21,12 @@ from utils.exceptions import (
     InputValidationError, APIError
 )
 from utils.turkish_parser import TurkishNumberParser, parse_number, format_turkish_number
-from utils.retry_helper import retry_with_backoff, retry_api_call
+from utils.retry_helper import retry_with_backoff, retry_api_call, RetryableAPIClient
 from utils.common import (
-    truncate_text, clean_text, word_count, paragraph_count,
+    truncate_text, clean_text, clean_text_batch, word_count, paragraph_count,
     format_number, format_percentage, format_currency, safe_divide,
-    format_file_size, generate_hash, generate_cache_key,
+    format_file_size, get_file_extension, generate_unique_filename,
+    generate_hash, generate_cache_key, BLAKE3_AVAILABLE,
     format_duration, chunked, unique_by, Result, BatchResult
 )
 
@@ -51,6 +52,13 @@ class TestPathValidator:
         with pytest.raises((PathTraversalError, InputValidationError)):
             PathValidator.validate("../../../etc/passwd", check_traversal=True)
 
+    def test_null_byte_rejected(self, tmp_path):
+        """Null byte iceren yol reddedilir."""
+        with pytest.raises((PathTraversalError, InputValidationError)):
+            PathValidator.validate(str(tmp_path / "a\x00b"), must_exist=False)
+        with pytest.raises(InputValidationError):
+            PathValidator.validate("a\x00b", must_exist=False, check_traversal=False)
+
     def test_nonexistent_file(self, tmp_path):
         """Var olmayan dosya."""
         # FileNotFoundError veya InputValidationError beklenir
@@ -68,6 +76,35 @@ class TestPathValidator:
         result = PathValidator.validate_directory(str(new_dir), create_if_missing=True)
         assert result.exists()
 
+    def test_validate_many(self, tmp_path):
+        """Toplu dogrulama tek tek dogrulama ile ayni sonucu verir."""
+        files = []
+        for name in ("a.txt", "b.txt"):
+            (tmp_path / name).write_text("x")
+            files.append(str(tmp_path / name))
+
+        expected = [PathValidator.validate(p, allowed_base=tmp_path) for p in files]
+        assert PathValidator.validate_many(files, allowed_base=tmp_path) == expected
+
+        with pytest.raises(PathTraversalError):
+            PathValidator.validate_many(files + ["/"], allowed_base=tmp_path, check_traversal=False)
+
+    def test_symlink_resolution(self, tmp_path):
+        """Symlink yalnizca istenirse veya allowed_base verilirse cozulur."""
+        target = tmp_path / "hedef"
+        target.mkdir()
+        link = tmp_path / "baglanti"
+        link.symlink_to(target)
+
+        assert PathValidator.validate(str(link)) == link
+        assert PathValidator.validate(str(link), resolve_symlinks=True) == target.resolve()
+
+        inside = tmp_path / "ic"
+        inside.mkdir()
+        (inside / "kacis").symlink_to(target)
+        with pytest.raises(PathTraversalError):
+            PathValidator.validate(str(inside / "kacis"), allowed_base=inside)
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # URL VALIDATOR TESTS
@@ -172,11 +209,21 @@ class TestTurkishNumberParser:
         result = TurkishNumberParser.parse("not a number", default=0.0)
         assert result == 0.0
 
+    def test_uppercase_multiplier(self):
+        """Buyuk harfli (Turkce I dahil) carpanlar."""
+        assert TurkishNumberParser.parse("1,5 Milyon") == 1_500_000
+        assert TurkishNumberParser.parse("2 MİLYAR") == 2_000_000_000
+
     def test_format_turkish_number(self):
         """Turkce formatlama."""
         result = format_turkish_number(1234.56)
         assert result == "1.234,56"
 
+    def test_extract_numbers(self):
+        """Metinden carpanli ve carpansiz sayilar, tekrarsiz."""
+        text = "Ciro 2,5 milyon ₺, kar 1.234,56 ₺; gecen yil yine 1.234,56 ₺"
+        assert TurkishNumberParser.extract_numbers(text) == [2_500_000.0, 2.5, 1234.56]
+
     def test_parse_number_shortcut(self):
         """parse_number kisa yol."""
         result = parse_number("1.234,56")
@@ -223,6 +270,14 @@ class TestRetryHelper:
         with pytest.raises(ValueError):
             always_fail()
 
+    def test_wait_schedule_is_precomputed(self):
+        """Bekleme plani dekorasyonda hesaplanir ve max_wait ile sinirlanir."""
+        @retry_with_backoff(max_attempts=5, min_wait=1, max_wait=3, multiplier=2)
+        def noop():
+            return None
+
+        assert noop.wait_schedule == (1, 2, 3, 3)
+
     def test_retry_api_call_function(self):
         """retry_api_call fonksiyonu."""
         mock_func = Mock(return_value="result")
@@ -232,6 +287,14 @@ class TestRetryHelper:
         assert result == "result"
         mock_func.assert_called_once_with("arg1", "arg2")
 
+    def test_client_attribute_is_cached(self):
+        """RetryableAPIClient cozulen attribute'u onbellege alir."""
+        inner = Mock()
+        client = RetryableAPIClient(inner)
+
+        assert client.messages is inner.messages
+        assert client.__dict__["messages"] is inner.messages
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # COMMON UTILITIES TESTS
@@ -256,6 +319,16 @@ class TestCommonUtilities:
         result = clean_text("  Hello   World  ")
         assert result == "Hello World"
 
+    def test_clean_text_mixed_whitespace(self):
+        """Tab, satir sonu, null ve Unicode bosluklar tek bosluga iner."""
+        result = clean_text("\tSatir\x00 1\n\n\u00a0Satir\u3000 2\r\n")
+        assert result == "Satir 1 Satir 2"
+
+    def test_clean_text_batch_matches_clean_text(self):
+        """Toplu temizleme tekil clean_text ile ayni sonucu verir."""
+        texts = ["  Hello   World  ", "\tA\x00 b\u00a0\u00a0c\n", "", None]
+        assert clean_text_batch(texts) == [clean_text(t) for t in texts]
+
     def test_word_count(self):
         """Kelime sayisi."""
         result = word_count("one two three four five")
@@ -272,6 +345,10 @@ class TestCommonUtilities:
         result = format_number(1234567.89, locale="tr")
         assert "." in result  # Binlik ayirici
         assert "," in result  # Ondalik ayirici
+        assert result == "1.234.567,89"
+        assert format_number(1234567, locale="tr") == "1.234.567"
+        assert format_number(1234567.891, locale="en") == "1,234,567.89"
+        assert format_number(1234567, locale="de") == "1,234,567"  # bilinmeyen -> en
 
     def test_format_percentage(self):
         """Yuzde formati."""
@@ -295,6 +372,21 @@ class TestCommonUtilities:
         assert "KB" in format_file_size(1500)
         assert "MB" in format_file_size(1500000)
 
+    def test_get_file_extension(self):
+        """Uzanti Path.suffix ile ayni, kucuk harf."""
+        assert get_file_extension("rapor.PDF") == ".pdf"
+        assert get_file_extension(Path("arsiv/veri.tar.GZ")) == ".gz"
+        assert get_file_extension(".gizli") == ""
+        assert get_file_extension("dosya.") == ""
+
+    def test_generate_unique_filename(self, tmp_path):
+        """Ayni saniyede uretilen adlar cakismaz."""
+        first = generate_unique_filename("rapor", ".pdf", tmp_path)
+        second = generate_unique_filename("rapor", ".pdf", tmp_path)
+        assert first != second
+        assert first.parent == tmp_path
+        assert first.name.startswith("rapor_") and first.suffix == ".pdf"
+
     def test_generate_hash(self):
         """Hash olusturma."""
         hash1 = generate_hash("test content")
@@ -302,11 +394,33 @@ class TestCommonUtilities:
         assert hash1 == hash2
         assert len(hash1) == 32  # MD5
 
+    def test_generate_hash_blake2b(self):
+        """Blake2b hash MD5 ile ayni uzunlukta."""
+        hash1 = generate_hash("test content", algorithm="blake2b")
+        assert hash1 == generate_hash("test content", algorithm="blake2b")
+        assert hash1 != generate_hash("test content")
+        assert len(hash1) == 32
+
+    @pytest.mark.skipif(not BLAKE3_AVAILABLE, reason="blake3 yuklu degil")
+    def test_generate_hash_blake3(self):
+        """Blake3 hash blake2b'den farkli, ayni uzunlukta."""
+        hash1 = generate_hash("test content", algorithm="blake3")
+        assert hash1 != generate_hash("test content", algorithm="blake2b")
+        assert len(hash1) == 32
+
+    @pytest.mark.skipif(BLAKE3_AVAILABLE, reason="blake3 yuklu")
+    def test_generate_hash_blake3_requires_package(self):
+        """blake3 paketi yoksa sessizce baska algoritmaya dusulmez."""
+        with pytest.raises(ImportError):
+            generate_hash("test content", algorithm="blake3")
+
     def test_generate_cache_key(self):
         """Cache key olusturma."""
         key1 = generate_cache_key("arg1", "arg2", option=True)
         key2 = generate_cache_key("arg1", "arg2", option=True)
         assert key1 == key2
+        assert len(key1) == 32
+        assert generate_cache_key("arg1", "arg2", option=False) != key1
 
     def test_format_duration(self):
         """Sure formati."""
@@ -314,6 +428,19 @@ class TestCommonUtilities:
         assert "m" in format_duration(120)
         assert "h" in format_duration(3700)
 
+    def test_load_yaml_reloads_changed_file(self, tmp_path):
+        """Degisen YAML yeniden okunur, donen veri paylasilmaz."""
+        from utils.helpers import load_yaml
+
+        config = tmp_path / "ayar.yaml"
+        config.write_text("a: 1\n", encoding="utf-8")
+        first = load_yaml(str(config))
+        first["a"] = 99
+        assert load_yaml(str(config)) == {"a": 1}
+
+        config.write_text("a: 1\nb: 2\n", encoding="utf-8")
+        assert load_yaml(str(config)) == {"a": 1, "b": 2}
+
     def test_chunked(self):
         """Liste parcalama."""
         items = list(range(10))
@@ -321,12 +448,15 @@ class TestCommonUtilities:
         assert len(chunks) == 4
         assert chunks[0] == [0, 1, 2]
         assert chunks[-1] == [9]
+        assert list(chunked(iter(items), 4)) == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
 
     def test_unique_by(self):
         """Benzersiz filtreleme."""
         items = [{"id": 1}, {"id": 2}, {"id": 1}, {"id": 3}]
         result = unique_by(items, key=lambda x: x["id"])
         assert len(result) == 3
+        assert result[0] is items[0]
+        assert unique_by([3, 1, 3, 2, 1]) == [3, 1, 2]
 
 
 class TestResultDataclasses:
@@ -381,6 +511,21 @@ class TestExceptions:
         error = APIError("API error message")
         assert isinstance(error, ReportGeneratorError)
 
+    def test_exception_slots_and_pickle(self):
+        """Slot alanlari pickle/copy sonrasi korunur."""
+        import copy
+        import pickle
+        from utils.exceptions import FileReadError
+
+        error = FileReadError("/tmp/rapor.pdf", reason="bozuk")
+        assert not hasattr(error, "__dict__") or error.__dict__ == {}
+
+        restored = pickle.loads(pickle.dumps(error))
+        assert type(restored) is FileReadError
+        assert restored.to_dict() == error.to_dict()
+        assert str(restored) == str(error)
+        assert copy.copy(error).code == "FILE_READ_ERROR"
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # RUN TESTS
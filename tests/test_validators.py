@@ -16,6 +16,7 @@ from validation.financial_validator import (
     FinancialValidator, ValidationResult, ValidationIssue,
     IssueSeverity, IssueCategory
 )
+from validation.cross_reference import CrossReferenceChecker
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -86,6 +87,16 @@ class TestFinancialValidator:
         numbers = validator._extract_numbers(content)
         assert "test" in numbers
 
+    def test_growth_keyword_case_insensitive(self, validator):
+        """Buyuk harfli buyume anahtar kelimesi de yakalanir."""
+        numbers = {"test": {"percentages": [
+            {"value": 600, "text": "ARTIŞ %600", "position": 0},
+            {"value": 600, "text": "%600", "position": 20},
+        ]}}
+        issues = validator._check_growth_rates(numbers)
+        assert len(issues) == 1
+        assert issues[0].severity == IssueSeverity.ERROR
+
     def test_parse_turkish_number(self, validator):
         """Turkce sayi parse."""
         result = validator._parse_number("1.234,56")
@@ -220,6 +231,66 @@ class TestEnums:
         assert IssueCategory.VALUE_INCONSISTENCY.value == "value_inconsistency"
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# CROSS REFERENCE TESTS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestCrossReferenceChecker:
+    """CrossReferenceChecker testleri."""
+
+    def test_extract_metrics(self):
+        """Bolumlerden metrikler carpanlariyla cikarilir."""
+        content = {
+            "yonetici_ozeti": "Pazar büyüklüğü: 2,5 milyar TL. Yıllık büyüme %12.",
+            "finansal_projeksiyonlar": "18 ay içinde başa baş noktasına ulaşılır.",
+        }
+        metrics = CrossReferenceChecker()._extract_all_metrics(content)
+
+        assert metrics["pazar_buyuklugu"] == {"yonetici_ozeti": 2_500_000_000.0}
+        assert metrics["buyume_orani"] == {"yonetici_ozeti": 12.0}
+        assert metrics["basa_bas_suresi"] == {"finansal_projeksiyonlar": 18.0}
+
+    def test_uppercase_turkish_keywords(self):
+        """Buyuk harfli Turkce metinde (I/İ) metrik on filtreden gecer."""
+        content = {"yonetici_ozeti": "YATIRIM İHTİYACI: 10 milyon TL"}
+        metrics = CrossReferenceChecker()._extract_all_metrics(content)
+
+        assert metrics == {"yatirim_ihtiyaci": {"yonetici_ozeti": 10.0}}
+
+    def test_outlier_first_section(self):
+        """Aykiri ilk bolum ortanca taban sayesinde tek sorun uretir."""
+        content = {
+            "yonetici_ozeti": "Yatırım ihtiyacı: 50",
+            "finansal_projeksiyonlar": "Yatırım ihtiyacı: 10",
+            "pazar_analizi": "Yatırım ihtiyacı: 10",
+        }
+        issues = CrossReferenceChecker().check(content)
+
+        assert [i.target_section for i in issues] == ["yonetici_ozeti"]
+
+    def test_only_metric_sections(self):
+        """only_metric_sections ile metrik yalnizca kendi bolumlerinden cikar."""
+        content = {
+            "yonetici_ozeti": "Başa baş: 18 ay",
+            "pazarlama_stratejisi": "Başa baş: 24 ay",
+        }
+        checker = CrossReferenceChecker(only_metric_sections=True)
+        metrics = checker._extract_all_metrics(content)
+
+        assert metrics == {"basa_bas_suresi": {"yonetici_ozeti": 18.0}}
+        assert len(CrossReferenceChecker()._extract_all_metrics(content)["basa_bas_suresi"]) == 2
+
+    def test_inconsistent_values(self):
+        """Bolumler arasi farkli degerler sorun olarak raporlanir."""
+        content = {
+            "yonetici_ozeti": "Yatırım ihtiyacı: 10 milyon TL",
+            "finansal_projeksiyonlar": "Yatırım ihtiyacı: 25 milyon TL",
+        }
+        issues = CrossReferenceChecker().check(content)
+
+        assert [i.metric for i in issues] == ["yatirim_ihtiyaci"]
+        assert issues[0].severity == "error"
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # RUN TESTS
 # ═══════════════════════════════════════════════════════════════════════════════